@@ -7,11 +7,37 @@ including season/episode detection and quality tag removal.
 
 import re
 import os
+import functools
 from ..config.constants import (
     QUALITY_PATTERN_SERIES, SEASON_EPISODE_PATTERN,
     ABBREVIATIONS, QUALITY_PATTERNS
 )
 
+# Compiled once at import so per-file parsing never goes through re's cache
+_SEASON_EPISODE_RE = re.compile(SEASON_EPISODE_PATTERN)
+_QUALITY_SERIES_RE = re.compile(QUALITY_PATTERN_SERIES, re.IGNORECASE)
+_QUALITY_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in QUALITY_PATTERNS)
+_ANY_QUALITY_RE = re.compile('|'.join('(?:%s)' % pattern for pattern in QUALITY_PATTERNS),
+                             re.IGNORECASE)
+_DELIMS_TO_SPACES = str.maketrans('._-', '   ')
+_ABBREVIATION_OR_DELIMS_RE = re.compile(
+    r'(?P<abbr>(?<![^\W_])(?:' + '|'.join(re.escape(abbrev) for abbrev in ABBREVIATIONS) + r'))|[._-]+')
+
+
+def _keep_abbreviation(match):
+    return match.group('abbr') or ' '
+
+
+def _delimiters_to_spaces(text):
+    """Turn delimiter runs into spaces, leaving abbreviation dots in place"""
+    return _ABBREVIATION_OR_DELIMS_RE.sub(_keep_abbreviation, text).strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_series_title(prefix):
+    """Series title from the text before SxxEyy; repeats for every episode of a show"""
+    return _delimiters_to_spaces(prefix)
+
 
 def extract_series_info(filename):
     """
@@ -25,12 +51,7 @@ def extract_series_info(filename):
     """
     base_name = os.path.splitext(filename)[0]
 
-    protected_name = base_name
-
-    for abbrev, placeholder in ABBREVIATIONS.items():
-        protected_name = protected_name.replace(abbrev, placeholder)
-
-    season_episode_match = re.search(SEASON_EPISODE_PATTERN, protected_name)
+    season_episode_match = _SEASON_EPISODE_RE.search(base_name)
     if not season_episode_match:
         return None, None, None, None, None
 
@@ -40,28 +61,13 @@ def extract_series_info(filename):
 
     # Extract series title
     series_title_end = season_episode_match.start()
-    series_title = protected_name[:series_title_end].strip()
-
-    series_title = re.sub(r'[._-]+$', '', series_title)
-    series_title = re.sub(r'[._-]+', ' ', series_title).strip()
+    series_title = _clean_series_title(base_name[:series_title_end])
 
     # Extract episode title
-    episode_part = protected_name[season_episode_match.end():].strip()
-    episode_part = re.sub(r'^[._-]+', '', episode_part)
-
-    episode_title = re.sub(QUALITY_PATTERN_SERIES, '',
-                           episode_part, flags=re.IGNORECASE).strip()
-    episode_title = re.sub(r'[._-]+$', '', episode_title)
-    episode_title = re.sub(r'[._-]+', ' ', episode_title).strip()
-
-    # Restore abbreviations in all parts
-    for abbrev, placeholder in ABBREVIATIONS.items():
-        series_title = series_title.replace(placeholder, abbrev)
-        if episode_title:
-            episode_title = episode_title.replace(placeholder, abbrev)
+    episode_part = base_name[season_episode_match.end():].strip().lstrip('._-')
 
-    series_title = series_title.strip()
-    episode_title = episode_title.strip() if episode_title else None
+    episode_title = _QUALITY_SERIES_RE.sub('', episode_part)
+    episode_title = _delimiters_to_spaces(episode_title) or None
 
     # Remove empty episode title
     if episode_title and (len(episode_title) < 2 or episode_title.lower() in ['episode', 'ep']):
@@ -82,10 +88,12 @@ def clean_filename_quality_tags(filename):
     """
     base_name = os.path.splitext(filename)[0]
 
-    for pattern in QUALITY_PATTERNS:
-        base_name = re.sub(pattern, '', base_name, flags=re.IGNORECASE)
+    # One combined scan decides whether any of the ordered removals can apply
+    if _ANY_QUALITY_RE.search(base_name):
+        for pattern in _QUALITY_RES:
+            base_name = pattern.sub('', base_name)
 
-    base_name = re.sub(r'[._-]+', ' ', base_name).strip()
-    base_name = re.sub(r'\s+', ' ', base_name)
+    # Delimiters become spaces, then split/join collapses every whitespace run
+    base_name = ' '.join(base_name.translate(_DELIMS_TO_SPACES).split())
 
     return base_name
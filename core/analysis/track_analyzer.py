@@ -6,17 +6,65 @@ This module contains functions for analyzing MKV track information
 import os
 import subprocess
 import json
+import sqlite3
+from contextlib import closing
 from ..utils.subprocess_utils import run_hidden
 
+try:
+    # orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 try:
     from ..config.user_config import get_user_config_manager
     _user_config = get_user_config_manager()
     _settings = _user_config.get_all_settings()
     _paths = _settings.get('paths', {})
     MKVMERGE_PATH = _paths.get('mkvmerge_path', 'mkvmerge')
+    TRACK_CACHE_FILE = os.path.join(str(_user_config.config_dir), "track_cache.sqlite")
     
 except ImportError:
     MKVMERGE_PATH = 'mkvmerge'
+    TRACK_CACHE_FILE = None
+
+# Bump when the cached track dictionaries change shape or meaning
+_TRACK_CACHE_TABLE = "track_info_v1"
+
+
+def _load_cached_tracks(real_path, stat):
+    """Tracks stored for this exact file version, or None"""
+    if not TRACK_CACHE_FILE:
+        return None
+
+    try:
+        with closing(sqlite3.connect(TRACK_CACHE_FILE, timeout=5)) as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {_TRACK_CACHE_TABLE} "
+                "(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, tracks TEXT)")
+            row = conn.execute(
+                f"SELECT tracks FROM {_TRACK_CACHE_TABLE} "
+                "WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (real_path, stat.st_mtime_ns, stat.st_size)).fetchone()
+    except sqlite3.Error:
+        return None
+
+    return json.loads(row[0]) if row else None
+
+
+def _store_cached_tracks(real_path, stat, tracks):
+    """Remember the tracks of this file version, replacing older entries"""
+    if not TRACK_CACHE_FILE:
+        return
+
+    try:
+        with closing(sqlite3.connect(TRACK_CACHE_FILE, timeout=5)) as conn:
+            with conn:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {_TRACK_CACHE_TABLE} VALUES (?, ?, ?, ?)",
+                    (real_path, stat.st_mtime_ns, stat.st_size, json.dumps(tracks)))
+    except sqlite3.Error as e:
+        print(f"Warning: Could not update track cache: {e}")
 
 
 def is_forced_subtitle_by_name(track_name):
@@ -59,9 +107,17 @@ def get_track_info(file_path):
             print(f"Error: File is not readable: {file_path}")
             return []
 
+        # Unchanged files (same path, mtime and size) skip mkvmerge entirely
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(file_path)
+        cached_tracks = _load_cached_tracks(real_path, stat)
+        if cached_tracks is not None:
+            return cached_tracks
+
         cmd = [MKVMERGE_PATH, "-J", file_path]
 
-        result = run_hidden(cmd, capture_output=True, text=True)
+        # Raw bytes straight into json.loads, no text-mode decoding of the payload
+        result = run_hidden(cmd, capture_output=True, encoding=None)
 
         if result is None:
             print(
@@ -71,8 +127,8 @@ def get_track_info(file_path):
         if result.returncode != 0:
             print(
                 f"Error: mkvmerge failed with return code {result.returncode}")
-            print(f"stdout: {result.stdout}")
-            print(f"stderr: {result.stderr}")
+            print(f"stdout: {result.stdout.decode('utf-8', 'replace')}")
+            print(f"stderr: {result.stderr.decode('utf-8', 'replace')}")
             return []
 
         if not result.stdout:
@@ -80,7 +136,7 @@ def get_track_info(file_path):
                 f"Error: mkvmerge returned empty output for file: {file_path}")
             return []
 
-        data = json.loads(result.stdout)
+        data = json_loads(result.stdout)
         tracks = []
 
         for track in data.get("tracks", []):
@@ -99,13 +155,14 @@ def get_track_info(file_path):
                 "track_name": track_name
             })
 
+        _store_cached_tracks(real_path, stat, tracks)
         return tracks
 
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON from mkvmerge output for file: {file_path}")
         print(f"JSON Error: {str(e)}")
         if result and result.stdout:
-            print(f"Raw output: {result.stdout[:500]}...")  # First 500 chars
+            print(f"Raw output: {result.stdout[:500].decode('utf-8', 'replace')}...")  # First 500 bytes
         return []
     except subprocess.CalledProcessError as e:
         print(f"Error running mkvmerge command: {str(e)}")
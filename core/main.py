@@ -5,17 +5,73 @@ Main script for command-line usage of the MKV manager.
 """
 
 import os
-from .processing.mkv_processor import filter_and_remux
+import itertools
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from .processing.mkv_processor import (
+    filter_and_remux, collect_log_entries, write_log_entries
+)
 from .config import MKV_FOLDER
 
 
+def _process_file(full_path):
+    """Remux one file in a worker and hand its log entries back with any error"""
+    print(f"Processing file: {full_path}")
+    with collect_log_entries() as entries:
+        try:
+            filter_and_remux(full_path)
+        except Exception as e:
+            # Returned rather than raised so the entries logged before it survive
+            return entries, e
+    return entries, None
+
+
 def main():
     """Main function to process all MKV files in the configured folder."""
-    for file in os.listdir(MKV_FOLDER):
-        if file.lower().endswith(".mkv"):
-            full_path = os.path.normpath(os.path.join(MKV_FOLDER, file))
-            print(f"Processing file: {full_path}")
-            filter_and_remux(full_path)
+    paths = []
+    with os.scandir(MKV_FOLDER) as entries:
+        for entry in entries:
+            # Lowercase only the suffix rather than every whole name
+            if entry.name[-4:].lower() == ".mkv" and entry.is_file():
+                paths.append(os.path.normpath(entry.path))
+
+    if not paths:
+        return
+
+    # Half the cores so parallel remuxes do not saturate the disk
+    workers = min(len(paths), max(1, (os.cpu_count() or 2) // 2))
+    futures = []
+    first_error = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Submit only as many files as there are workers: anything handed to the
+            # pool beyond that is already queued and can no longer be cancelled
+            remaining = iter(paths)
+            running = set()
+            while True:
+                if first_error is None:
+                    for path in itertools.islice(remaining, workers - len(running)):
+                        future = executor.submit(_process_file, path)
+                        futures.append(future)
+                        running.add(future)
+                if not running:
+                    break
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    error = future.result()[1]
+                    if error is not None and first_error is None:
+                        # No new files start after a failure; the ones already
+                        # being remuxed are left to finish
+                        first_error = error
+    finally:
+        # Written once at the end, in input order, covering every file that ran
+        log_entries = []
+        for future in futures:
+            if future.done() and future.exception() is None:
+                log_entries.extend(future.result()[0])
+        write_log_entries(log_entries)
+
+    if first_error is not None:
+        raise first_error
 
 
 if __name__ == "__main__":
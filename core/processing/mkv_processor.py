@@ -7,6 +7,9 @@ all the other modules to filter and remux MKV files.
 
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from ..analysis.track_analyzer import get_track_info
 from ..analysis.filename_processor import extract_series_info
@@ -53,15 +56,50 @@ except ImportError:
     MKVMERGE_PATH = 'mkvmerge'
 
 
+_collected_log_entries = None
+
+# Runs mkvmerge -J in the background while a file's names and folders are worked out
+_track_probe_pool = ThreadPoolExecutor(max_workers=2)
+
+
+@contextmanager
+def collect_log_entries():
+    """Hold log_entry() output in a list instead of appending to the log files"""
+    global _collected_log_entries
+    entries = []
+    _collected_log_entries = entries
+    try:
+        yield entries
+    finally:
+        _collected_log_entries = None
+
+
+def write_log_entries(entries):
+    """Append collected (log_file, entry) pairs, opening each log file once"""
+    by_file = {}
+    for log_file, entry in entries:
+        by_file.setdefault(log_file, []).append(entry)
+
+    for log_file, file_entries in by_file.items():
+        with open(log_file, "a", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(file_entries)
+
+
 def log_entry(file_name, changes, log_file=None):
     """Log processing changes to a file"""
     if log_file is None:
         log_file = os.path.join(OUTPUT_FOLDER, "mkv_process_log.txt")
 
+    # One write per entry so entries from parallel workers never interleave
+    entry = f"\n[{datetime.now()}] {file_name}\n" + "".join(
+        f"  - {line}\n" for line in changes)
+
+    if _collected_log_entries is not None:
+        _collected_log_entries.append((log_file, entry))
+        return
+
     with open(log_file, "a", encoding="utf-8") as f:
-        f.write(f"\n[{datetime.now()}] {file_name}\n")
-        for line in changes:
-            f.write(f"  - {line}\n")
+        f.write(entry)
 
 
 def filter_and_remux(file_path, output_folder=None, preferences=None, extract_subtitles=False, progress_callback=None):
@@ -75,7 +113,9 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
         extract_subtitles: Whether to extract subtitles (optional)
         progress_callback: Callback function for progress updates (optional)
     """
-    source_dir = os.path.dirname(file_path)
+    source_dir, file_name = os.path.split(file_path)
+
+    track_probe = _track_probe_pool.submit(get_track_info, file_path)
 
     if preferences:
         allowed_audio_langs = set(preferences.get(
@@ -136,10 +176,10 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
                 f"INFO: Could not create output folder in {source_dir}, using default: {output_folder}")
             print(f"   Reason: {str(e)}")
 
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    base_name = os.path.splitext(file_name)[0]
 
     series_title, season_episode_tag, season_num, episode_num, episode_title = extract_series_info(
-        os.path.basename(file_path))
+        file_name)
 
     if series_title and season_episode_tag:
         if episode_title:
@@ -156,7 +196,7 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
 
     output_file = os.path.join(output_folder, output_name)
 
-    tracks = get_track_info(file_path)
+    tracks = track_probe.result()
 
     cmd = [MKVMERGE_PATH, "-o", output_file, "--title", title_for_mkv]
     change_log = []
@@ -171,6 +211,14 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
     audio_tracks = []
     subtitle_tracks = []
 
+    # Per-language audio flags and titles resolved once per file instead of once per track
+    audio_flags = {
+        lang: ('yes' if lang == default_audio_lang else 'no',
+               'yes' if lang == original_audio_lang else 'no',
+               LANG_TITLES.get(lang, lang))
+        for lang in allowed_audio_langs
+    }
+
     for t in tracks:
         tid = t["id"]
         ttype = t["type"]
@@ -178,25 +226,22 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
         forced = t.get("forced", False)
         hearing_impaired = t.get("hearing_impaired", False)
         track_name = t.get("track_name", "")
-        title = LANG_TITLES.get(lang, lang)
 
         if ttype == "video":
             video_tracks.append(str(tid))
-            cmd += ["--language", f"{tid}:und"]
-            cmd += ["--track-name", f"{tid}:"]
+            cmd.extend(("--language", f"{tid}:und", "--track-name", f"{tid}:"))
             change_log.append(
                 f"Keep video track {tid} (no linguistic content)")
 
         elif ttype == "audio":
-            if lang in allowed_audio_langs:
+            if lang in audio_flags:
                 audio_tracks.append(str(tid))
-                is_def = (lang == default_audio_lang)
-                is_original = (lang == original_audio_lang)
-                cmd += ["--default-track",
-                        f"{tid}:{'yes' if is_def else 'no'}"]
-                cmd += ["--original-flag",
-                        f"{tid}:{'yes' if is_original else 'no'}"]
-                cmd += ["--track-name", f"{tid}:{title}"]
+                default_flag, original_flag, title = audio_flags[lang]
+                is_def = default_flag == 'yes'
+                is_original = original_flag == 'yes'
+                cmd.extend(("--default-track", f"{tid}:{default_flag}",
+                            "--original-flag", f"{tid}:{original_flag}",
+                            "--track-name", f"{tid}:{title}"))
 
                 if is_def:
                     change_log.append(f"Set audio {tid} [{title}] as default")
@@ -206,9 +251,11 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
                 if is_original:
                     change_log.append(f"Set audio {tid} [{title}] as original")
             else:
-                change_log.append(f"Removed audio track {tid} [{title}]")
+                change_log.append(
+                    f"Removed audio track {tid} [{LANG_TITLES.get(lang, lang)}]")
 
         elif ttype == "subtitles":
+            title = LANG_TITLES.get(lang, lang)
             is_forced_original = forced and lang == original_subtitle_lang
             is_allowed_lang = lang in allowed_sub_langs
             is_forced_for_audio = forced and lang in allowed_audio_langs
@@ -296,7 +343,18 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
     if progress_callback:
         run_mkvmerge(cmd, progress_callback)
     else:
-        run_hidden(cmd, check=True)
+        # Collected in large reads instead of streaming mkvmerge's progress spam
+        result = run_hidden(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, encoding=None)
+        output = result.stdout.decode('utf-8', 'replace')
+        if result.returncode != 0:
+            print(output)
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, result.stdout)
+        # Successful remuxes can still carry mkvmerge warnings worth showing
+        for line in output.splitlines():
+            if line.startswith("Warning:"):
+                print(line)
 
     print(f"Saved: {output_file}")
 
@@ -335,4 +393,4 @@ def filter_and_remux(file_path, output_folder=None, preferences=None, extract_su
             pass
 
     log_file = os.path.join(output_folder, "mkv_process_log.txt")
-    log_entry(os.path.basename(file_path), change_log, log_file)
+    log_entry(file_name, change_log, log_file)
@@ -4,10 +4,13 @@ Handles language configuration and settings management
 """
 
 from tkinter import messagebox
+from types import MappingProxyType
 
-ICONS = {
+ICONS = MappingProxyType({
     'success': '✅'
-}
+})
+
+ICON_SUCCESS = ICONS['success']
 
 
 class LanguageSettingsController:
@@ -48,7 +51,7 @@ class LanguageSettingsController:
             self.gui.update_config_display()
 
             messagebox.showinfo("Settings Saved",
-                                f"{ICONS['success']} Language settings have been updated successfully!")
+                                f"{ICON_SUCCESS} Language settings have been updated successfully!")
 
         except Exception as e:
             messagebox.showerror(
@@ -3,7 +3,7 @@
 File selection component for MKV Cleaner Desktop Application
 """
 
-from styles import UIHelpers
+from styles import UIHelpers, ensure_style
 from tkinter import ttk
 import os
 import sys
@@ -96,6 +96,7 @@ class FileSelectionComponent:
         file_tree.column('Size', width=80)
         file_tree.column('Series', width=220)
 
+        ensure_style('scrollbar')
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=file_tree.yview,
                                   style='Modern.Vertical.TScrollbar')
         file_tree.configure(yscrollcommand=scrollbar.set)
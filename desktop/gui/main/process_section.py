@@ -3,7 +3,7 @@
 Process section component for MKV Cleaner Desktop Application
 """
 
-from styles import UIHelpers
+from styles import UIHelpers, ensure_style
 from tkinter import ttk
 import os
 import sys
@@ -38,6 +38,7 @@ class ProcessSectionComponent:
             )
             progress_bar.grid(row=0, column=0, sticky='ew', pady=(0, 10))
         except:
+            ensure_style('progressbar')
             progress_bar = ttk.Progressbar(
                 process_frame, mode='determinate',
                 style='Modern.Horizontal.TProgressbar',
@@ -10,7 +10,7 @@ from core.config import (
     ORIGINAL_AUDIO_LANG, ORIGINAL_SUBTITLE_LANG
 )
 from core.config.constants import LANG_TITLES
-from styles import ModernStyleManager, ModernColorScheme
+from styles import ModernStyleManager, ModernColorScheme, create_named_fonts
 from .mixins import ScrollMixin, DragDropMixin
 from .main import (
     HeaderComponent, LanguageSettingsComponent, FileSelectionComponent,
@@ -52,6 +52,7 @@ class MKVCleanerGUI(ScrollMixin, DragDropMixin):
         self.root.geometry("1000x800")
         
         self._set_window_icon()
+        create_named_fonts(self.root)
 
         self.controller = MKVCleanerController(self)
 
@@ -5,400 +5,512 @@ This module contains all color schemes, ttk styles, and UI configuration
 """
 
 import tkinter as tk
-from tkinter import ttk
-import platform
+import tkinter.font as tkfont
+from types import MappingProxyType
+import functools
+import sys
 
 # lazy import to avoid circular import errors
 HAS_IMAGES = None
 get_icon = None
 
 
+@functools.lru_cache(maxsize=None)
 def _lazy_import_icons():
-    """Lazy import of icon utilities to avoid circular imports"""
+    """Lazy import of icon utilities to avoid circular imports, resolved once"""
     global HAS_IMAGES, get_icon
-    if HAS_IMAGES is None:
-        try:
-            from gui.utils.image_utils import get_icon as _get_icon
-            HAS_IMAGES = True
-            get_icon = _get_icon
-        except ImportError:
-            HAS_IMAGES = False
-            get_icon = None
+    try:
+        from gui.utils.image_utils import get_icon as _get_icon
+        HAS_IMAGES = True
+        get_icon = _get_icon
+    except ImportError:
+        HAS_IMAGES = False
+        get_icon = None
     return HAS_IMAGES, get_icon
 
 
+_STATUS_COLOR_KEYS = MappingProxyType({
+    'info': 'accent_light',
+    'success': 'success_light',
+    'danger': 'danger_light',
+    'error': 'danger'
+})
+
+
+_HOVER_PROC = '::mkv_hover_bg'
+_hover_proc_interps = set()
+
+
+def _ensure_hover_proc(widget):
+    """Register the Tcl hover proc once per interpreter"""
+    interp_id = id(widget.tk)
+    if interp_id not in _hover_proc_interps:
+        widget.tk.call('proc', _HOVER_PROC, 'w color', '$w configure -bg $color')
+        _hover_proc_interps.add(interp_id)
+
+
+_DROP_ZONE_TAG = 'MkvDropZoneSuppress'
+_drop_zone_tag_interps = set()
+
+
+def _ensure_drop_zone_bindtag(widget):
+    """Define the shared drop zone suppression bindtag once per interpreter"""
+    interp_id = id(widget.tk)
+    if interp_id not in _drop_zone_tag_interps:
+        for sequence in ('<FocusIn>', '<FocusOut>', '<Button-1>', '<ButtonRelease-1>'):
+            widget.bind_class(_DROP_ZONE_TAG, sequence, 'break')
+        _drop_zone_tag_interps.add(interp_id)
+
+
+_COLORS = {
+    # Main background colors - pure white throughout
+    'bg': '#ffffff',                # Pure white background everywhere
+    'card_bg': '#ffffff',           # Pure white for cards
+    'surface': '#ffffff',           # Pure white surface
+
+    # Primary accent colors - stronger blues for better contrast
+    'accent': '#075fc4',            # GitHub blue - AAA contrast
+    'accent_hover': '#0860ca',      # Darker hover state
+    'accent_light': '#dbeafe',      # Light blue background
+    'accent_dark': '#0550ae',       # Dark blue for high contrast
+
+    # Semantic colors with better contrast ratios
+    'success': '#1a7f37',           # Darker green for better contrast
+    'success_light': '#dcfce7',     # Light green background
+    'success_hover': '#166534',     # Darker green hover
+
+    'danger': '#cf222e',            # Darker red for better contrast
+    'danger_light': '#ffeef0',      # Light red background
+    'danger_hover': '#a40e26',      # Darker red hover
+
+    # Text colors with enhanced contrast ratios
+    'text': '#1f2328',              # Almost black for maximum contrast
+    'text_secondary': '#656d76',    # Medium gray for secondary text
+    'text_muted': '#8b949e',        # Lighter gray for muted text
+    'text_inverse': '#ffffff',      # White text for dark backgrounds
+
+    # Border and divider colors
+    'border': '#d1d9e0',            # Visible border color
+    'border_light': '#eaeef2',      # Light border
+    'border_strong': '#8b949e',     # Strong border for emphasis
+    'button_border': '#075fc4',
+
+    # Interactive element colors
+    'drop_zone': '#f0f6ff',         # Light blue for drop zone
+    'drop_zone_hover': '#e1eeff',   # Darker blue for hover
+    'drop_zone_active': '#d2e7ff',  # Active state
+    'drop_zone_border': '#075fc4',  # Border color for drop zone
+
+    # Shadow and depth
+    'shadow': '#e4e5e5',            # pre-composited shadow (rgba(31, 35, 40, 0.12) on white)
+    'shadow_strong': '#d2d3d4',     # pre-composited shadow (rgba(31, 35, 40, 0.2) on white)
+
+    # Focus and selection colors
+    'focus': '#075fc4',             # Focus ring color
+    'selection': '#075fc4',         # Selection background
+    'selection_light': '#e6f3ff',   # Light selection background
+}
+
+# Interned so the same hex strings are shared by every style and widget option
+COLORS = MappingProxyType({name: sys.intern(value) for name, value in _COLORS.items()})
+
+
 class ModernColorScheme:
     """Modern color scheme with enhanced contrast and accessibility"""
 
-    def __init__(self):
-        self.colors = {
-            # Main background colors - pure white throughout
-            'bg': '#ffffff',                # Pure white background everywhere
-            'card_bg': '#ffffff',           # Pure white for cards
-            'surface': '#ffffff',           # Pure white surface
-
-            # Primary accent colors - stronger blues for better contrast
-            'accent': '#075fc4',            # GitHub blue - AAA contrast
-            'accent_hover': '#0860ca',      # Darker hover state
-            'accent_light': '#dbeafe',      # Light blue background
-            'accent_dark': '#0550ae',       # Dark blue for high contrast
-
-            # Semantic colors with better contrast ratios
-            'success': '#1a7f37',           # Darker green for better contrast
-            'success_light': '#dcfce7',     # Light green background
-            'success_hover': '#166534',     # Darker green hover
-
-            'danger': '#cf222e',            # Darker red for better contrast
-            'danger_light': '#ffeef0',      # Light red background
-            'danger_hover': '#a40e26',      # Darker red hover
-
-            # Text colors with enhanced contrast ratios
-            'text': '#1f2328',              # Almost black for maximum contrast
-            'text_secondary': '#656d76',    # Medium gray for secondary text
-            'text_muted': '#8b949e',        # Lighter gray for muted text
-            'text_inverse': '#ffffff',      # White text for dark backgrounds
-
-            # Border and divider colors
-            'border': '#d1d9e0',            # Visible border color
-            'border_light': '#eaeef2',      # Light border
-            'border_strong': '#8b949e',     # Strong border for emphasis
-            'button_border': '#075fc4',
-
-            # Interactive element colors
-            'drop_zone': '#f0f6ff',         # Light blue for drop zone
-            'drop_zone_hover': '#e1eeff',   # Darker blue for hover
-            'drop_zone_active': '#d2e7ff',  # Active state
-            'drop_zone_border': '#075fc4',  # Border color for drop zone
-
-            # Shadow and depth
-            'shadow': 'rgba(31, 35, 40, 0.12)',
-            'shadow_strong': 'rgba(31, 35, 40, 0.2)',
-
-            # Focus and selection colors
-            'focus': '#075fc4',             # Focus ring color
-            'selection': '#075fc4',         # Selection background
-            'selection_light': '#e6f3ff',   # Light selection background
-        }
+    __slots__ = ('colors',)
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance.colors = COLORS
+            cls._instance = instance
+        return cls._instance
 
     def get_color(self, name):
         """Get color by name"""
-        return self.colors.get(name, '#000000')
+        try:
+            return self.colors[name]
+        except KeyError:
+            return '#000000'
 
     def get_all_colors(self):
-        """Get all colors dictionary"""
-        return self.colors.copy()
+        """Get all colors mapping (shared and read-only)"""
+        return self.colors
+
+
+def _build_style_table(colors):
+    """Style table: group -> ((style name, configure options, state map), ...)"""
+    bg, card_bg, surface = colors['bg'], colors['card_bg'], colors['surface']
+    text, text_secondary = colors['text'], colors['text_secondary']
+    text_muted, text_inverse = colors['text_muted'], colors['text_inverse']
+    border, border_light = colors['border'], colors['border_light']
+    border_strong = colors['border_strong']
+    accent, focus = colors['accent'], colors['focus']
+    selection, selection_light = colors['selection'], colors['selection_light']
+    success, success_hover = colors['success'], colors['success_hover']
+
+    scrollbar = {
+        'background': surface,
+        'troughcolor': border_light,
+        'borderwidth': 0,
+        'arrowcolor': text_secondary,
+        'darkcolor': border,
+        'lightcolor': card_bg,
+        'gripcount': 0,
+        'relief': 'flat',
+    }
+    scrollbar_map = {
+        'background': [('active', border),
+                       ('pressed', border_strong)],
+    }
+
+    return {
+        'frame': (
+            # Modern label frame with white background
+            ('Modern.TLabelframe', {
+                'background': bg,
+                'borderwidth': 1,
+                'relief': 'solid',
+                'bordercolor': border,
+                'lightcolor': bg,
+                'darkcolor': border,
+            }, None),
+            ('Modern.TLabelframe.Label', {
+                'background': bg,
+                'font': ('Segoe UI', 12, 'bold'),
+                'foreground': text,
+                'padding': (10, 5),
+            }, None),
+            # Card-style label frame with subtle shadow effect
+            ('Card.TLabelframe', {
+                'background': card_bg,
+                'borderwidth': 1,
+                'relief': 'solid',
+                'bordercolor': border,
+                'lightcolor': card_bg,
+                'darkcolor': border,
+            }, None),
+            ('Card.TLabelframe.Label', {
+                'background': card_bg,
+                'font': ('Segoe UI', 12, 'bold'),
+                'foreground': text,
+                'padding': (10, 5),
+            }, None),
+            ('Modern.TFrame', {
+                'background': bg,
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            # Card frame for content sections
+            ('Card.TFrame', {
+                'background': card_bg,
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            # Surface frame for elevation
+            ('Surface.TFrame', {
+                'background': surface,
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+        ),
+        'label': (
+            ('Modern.TLabel', {
+                'background': bg,
+                'foreground': text,
+                'font': ('Segoe UI', 10),
+                'padding': (4, 2),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            ('Title.TLabel', {
+                'background': bg,
+                'foreground': text,
+                'font': ('Segoe UI', 18, 'bold'),
+                'padding': (0, 10),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            ('Subtitle.TLabel', {
+                'background': bg,
+                'foreground': text_secondary,
+                'font': ('Segoe UI', 11),
+                'padding': (0, 5),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            ('SectionHeader.TLabel', {
+                'background': bg,
+                'foreground': text,
+                'font': ('Segoe UI', 12, 'bold'),
+                'padding': (0, 8),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+            ('Info.TLabel', {
+                'background': bg,
+                'foreground': text_secondary,
+                'font': ('Segoe UI', 9, 'italic'),
+                'padding': (0, 4),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, None),
+        ),
+        'entry': (
+            ('Modern.TEntry', {
+                'fieldbackground': bg,
+                'borderwidth': 2,
+                'relief': 'solid',
+                'bordercolor': border,
+                'font': ('Segoe UI', 10),
+                'padding': (12, 10),
+                'focuscolor': focus,
+                'foreground': text,
+                'selectbackground': selection,
+                'selectforeground': text_inverse,
+            }, {
+                'bordercolor': [('focus', accent),
+                                ('active', accent)],
+                'fieldbackground': [('focus', bg),
+                                    ('readonly', surface)],
+                'foreground': [('disabled', text_muted)],
+            }),
+        ),
+        'treeview': (
+            ('Modern.Treeview', {
+                'background': bg,
+                'foreground': text,
+                'fieldbackground': bg,
+                'font': ('Segoe UI', 9),
+                'rowheight': 32,
+                'borderwidth': 1,
+                'relief': 'solid',
+                'bordercolor': border,
+                'selectbackground': selection_light,
+                'selectforeground': text,
+            }, {
+                'background': [('selected', selection_light)],
+                'foreground': [('selected', text)],
+                'fieldbackground': [('selected', selection_light)],
+            }),
+            ('Modern.Treeview.Heading', {
+                'background': surface,
+                'foreground': text,
+                'font': ('Segoe UI', 9, 'bold'),
+                'relief': 'flat',
+                'borderwidth': 1,
+                'bordercolor': border,
+                'padding': (10, 8),
+            }, {
+                'background': [('active', border_light),
+                               ('pressed', border)],
+            }),
+        ),
+        'radiobutton': (
+            ('Modern.TRadiobutton', {
+                'background': bg,
+                'foreground': text,
+                'font': ('Segoe UI', 10),
+                'focuscolor': focus,
+                'padding': (8, 6),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, {
+                'background': [('active', bg),
+                               ('selected', bg)],
+                'foreground': [('disabled', text_muted)],
+            }),
+        ),
+        'checkbutton': (
+            ('Modern.TCheckbutton', {
+                'background': bg,
+                'foreground': text,
+                'font': ('Segoe UI', 10),
+                'focuscolor': focus,
+                'padding': (8, 6),
+                'borderwidth': 0,
+                'relief': 'flat',
+            }, {
+                'background': [('active', bg),
+                               ('selected', bg)],
+                'foreground': [('disabled', text_muted)],
+            }),
+        ),
+        'combobox': (
+            ('Modern.TCombobox', {
+                'background': bg,
+                'foreground': text,
+                'fieldbackground': bg,
+                'borderwidth': 2,
+                'bordercolor': border,
+                'lightcolor': bg,
+                'darkcolor': border,
+                'font': ('Segoe UI', 10),
+                'padding': (12, 10),
+                'relief': 'solid',
+                'arrowcolor': text_secondary,
+            }, {
+                'background': [('active', bg),
+                               ('focus', bg)],
+                'foreground': [('active', text),
+                               ('focus', text)],
+                'fieldbackground': [('active', bg),
+                                    ('focus', bg)],
+                'bordercolor': [('active', accent),
+                                ('focus', accent)],
+            }),
+        ),
+        'progressbar': (
+            ('Modern.Horizontal.TProgressbar', {
+                'background': success,
+                'troughcolor': border_light,
+                'borderwidth': 1,
+                'lightcolor': success,
+                'darkcolor': success_hover,
+                'thickness': 14,
+                'relief': 'flat',
+                'bordercolor': border,
+                'foreground': success,
+            }, {
+                'background': [('active', success),
+                               ('pressed', success_hover)],
+            }),
+        ),
+        'scrollbar': (
+            ('Modern.Vertical.TScrollbar', scrollbar, scrollbar_map),
+            ('Modern.Horizontal.TScrollbar', scrollbar, scrollbar_map),
+        ),
+    }
+
+
+def _fast_configure(style, name, options):
+    """ttk::style configure without ttk.Style's per-option formatting"""
+    args = []
+    for option, value in options.items():
+        args += ('-' + option, value)
+    style.tk.call('ttk::style', 'configure', name, *args)
+
+
+def _fast_map(style, name, state_map):
+    """ttk::style map with state specs flattened to statespec/value pairs"""
+    args = []
+    for option, specs in state_map.items():
+        flat = []
+        for spec in specs:
+            flat += (spec[:-1] if len(spec) > 2 else spec[0], spec[-1])
+        args += ('-' + option, tuple(flat))
+    style.tk.call('ttk::style', 'map', name, *args)
+
+
+_STYLES_INITIALIZED = False
+_configured_styles = set()
+_ensured_style_groups = set()
+
+# Groups configured on first use via ensure_style() instead of at startup
+_LAZY_STYLE_GROUPS = frozenset(('progressbar', 'scrollbar'))
+
+
+def ensure_style(group):
+    """Make sure a lazily configured style group is set up"""
+    if group not in _ensured_style_groups:
+        ModernStyleManager(ModernColorScheme()).ensure_style(group)
 
 
 class ModernStyleManager:
     """Manager for modern ttk styles"""
 
+    _style = None
+
     def __init__(self, color_scheme):
-        self.colors = color_scheme.get_all_colors()
-        self.style = ttk.Style()
-
-        available_themes = self.style.theme_names()
-        if 'vista' in available_themes:
-            self.style.theme_use('vista')
-        elif 'winnative' in available_themes:
-            self.style.theme_use('winnative')
-        elif 'clam' in available_themes:
-            self.style.theme_use('clam')
-        else:
-            pass
-
-    def _setup_frame_styles(self):
-        """Configure modern frame styles with enhanced visual hierarchy"""
-        # Modern label frame with white background
-        self.style.configure('Modern.TLabelframe',
-                             background=self.colors['bg'],
-                             borderwidth=1,
-                             relief='solid',
-                             bordercolor=self.colors['border'],
-                             lightcolor=self.colors['bg'],
-                             darkcolor=self.colors['border'])
-
-        self.style.configure('Modern.TLabelframe.Label',
-                             background=self.colors['bg'],
-                             font=('Segoe UI', 12, 'bold'),
-                             foreground=self.colors['text'],
-                             padding=(10, 5))
-
-        # Card-style label frame with subtle shadow effect
-        self.style.configure('Card.TLabelframe',
-                             background=self.colors['card_bg'],
-                             borderwidth=1,
-                             relief='solid',
-                             bordercolor=self.colors['border'],
-                             lightcolor=self.colors['card_bg'],
-                             darkcolor=self.colors['border'])
-
-        self.style.configure('Card.TLabelframe.Label',
-                             background=self.colors['card_bg'],
-                             font=('Segoe UI', 12, 'bold'),
-                             foreground=self.colors['text'],
-                             padding=(10, 5))
-
-        # Main frame
-        self.style.configure('Modern.TFrame',
-                             background=self.colors['bg'],
-                             borderwidth=0,
-                             relief='flat')
-
-        # Card frame for content sections
-        self.style.configure('Card.TFrame',
-                             background=self.colors['card_bg'],
-                             borderwidth=0,
-                             relief='flat')
-
-        # Surface frame for elevation
-        self.style.configure('Surface.TFrame',
-                             background=self.colors['surface'],
-                             borderwidth=0,
-                             relief='flat')
-
-    def _setup_entry_styles(self):
-        """Configure modern entry styles with enhanced accessibility"""
-        self.style.configure('Modern.TEntry',
-                             fieldbackground=self.colors['bg'],
-                             borderwidth=2,
-                             relief='solid',
-                             bordercolor=self.colors['border'],
-                             font=('Segoe UI', 10),
-                             padding=(12, 10),
-                             focuscolor=self.colors['focus'],
-                             foreground=self.colors['text'],
-                             selectbackground=self.colors['selection'],
-                             selectforeground=self.colors['text_inverse'])
-
-        self.style.map('Modern.TEntry',
-                       bordercolor=[('focus', self.colors['accent']),
-                                    ('active', self.colors['accent'])],
-                       fieldbackground=[('focus', self.colors['bg']),
-                                        ('readonly', self.colors['surface'])],
-                       foreground=[('disabled', self.colors['text_muted'])])
-
-    def _setup_treeview_styles(self):
-        """Configure modern treeview styles with enhanced readability"""
-        self.style.configure('Modern.Treeview',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             fieldbackground=self.colors['bg'],
-                             font=('Segoe UI', 9),
-                             rowheight=32,
-                             borderwidth=1,
-                             relief='solid',
-                             bordercolor=self.colors['border'],
-                             selectbackground=self.colors['selection_light'],
-                             selectforeground=self.colors['text'])
-
-        self.style.configure('Modern.Treeview.Heading',
-                             background=self.colors['surface'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 9, 'bold'),
-                             relief='flat',
-                             borderwidth=1,
-                             bordercolor=self.colors['border'],
-                             padding=(10, 8))
-
-        self.style.map('Modern.Treeview',
-                       background=[
-                           ('selected', self.colors['selection_light'])],
-                       foreground=[('selected', self.colors['text'])],
-                       fieldbackground=[('selected', self.colors['selection_light'])])
-
-        self.style.map('Modern.Treeview.Heading',
-                       background=[('active', self.colors['border_light']),
-                                   ('pressed', self.colors['border'])])
-
-    def _setup_label_styles(self):
-        """Configure modern label styles with proper backgrounds"""
-        # Modern label style with white background
-        self.style.configure('Modern.TLabel',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 10),
-                             padding=(4, 2),
-                             borderwidth=0,
-                             relief='flat')
-
-        # Title label style
-        self.style.configure('Title.TLabel',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 18, 'bold'),
-                             padding=(0, 10),
-                             borderwidth=0,
-                             relief='flat')
-
-        # Subtitle label style
-        self.style.configure('Subtitle.TLabel',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text_secondary'],
-                             font=('Segoe UI', 11),
-                             padding=(0, 5),
-                             borderwidth=0,
-                             relief='flat')
-
-        # Section header label style
-        self.style.configure('SectionHeader.TLabel',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 12, 'bold'),
-                             padding=(0, 8),
-                             borderwidth=0,
-                             relief='flat')
-
-        # Info label style
-        self.style.configure('Info.TLabel',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text_secondary'],
-                             font=('Segoe UI', 9, 'italic'),
-                             padding=(0, 4),
-                             borderwidth=0,
-                             relief='flat')
-
-    def _setup_radiobutton_styles(self):
-        """Configure modern radiobutton styles with better contrast"""
-        self.style.configure('Modern.TRadiobutton',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 10),
-                             focuscolor=self.colors['focus'],
-                             padding=(8, 6),
-                             borderwidth=0,
-                             relief='flat')
-
-        self.style.map('Modern.TRadiobutton',
-                       background=[('active', self.colors['bg']),
-                                   ('selected', self.colors['bg'])],
-                       foreground=[('disabled', self.colors['text_muted'])])
-
-    def _setup_checkbutton_styles(self):
-        """Configure modern checkbutton styles with consistent backgrounds"""
-        self.style.configure('Modern.TCheckbutton',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             font=('Segoe UI', 10),
-                             focuscolor=self.colors['focus'],
-                             padding=(8, 6),
-                             borderwidth=0,
-                             relief='flat')
-
-        self.style.map('Modern.TCheckbutton',
-                       background=[('active', self.colors['bg']),
-                                   ('selected', self.colors['bg'])],
-                       foreground=[('disabled', self.colors['text_muted'])])
-
-    def _setup_combobox_styles(self):
-        """Configure modern combobox styles with consistent backgrounds"""
-        self.style.configure('Modern.TCombobox',
-                             background=self.colors['bg'],
-                             foreground=self.colors['text'],
-                             fieldbackground=self.colors['bg'],
-                             borderwidth=2,
-                             bordercolor=self.colors['border'],
-                             lightcolor=self.colors['bg'],
-                             darkcolor=self.colors['border'],
-                             font=('Segoe UI', 10),
-                             padding=(12, 10),
-                             relief='solid',
-                             arrowcolor=self.colors['text_secondary'])
-
-        self.style.map('Modern.TCombobox',
-                       background=[('active', self.colors['bg']),
-                                   ('focus', self.colors['bg'])],
-                       foreground=[('active', self.colors['text']),
-                                   ('focus', self.colors['text'])],
-                       fieldbackground=[('active', self.colors['bg']),
-                                        ('focus', self.colors['bg'])],
-                       bordercolor=[('active', self.colors['accent']),
-                                    ('focus', self.colors['accent'])])
-
-    def _setup_progressbar_styles(self):
-        """Configure modern progressbar styles with enhanced visibility"""
-        self.style.configure('Modern.Horizontal.TProgressbar',
-                             background=self.colors['success'],
-                             troughcolor=self.colors['border_light'],
-                             borderwidth=1,
-                             lightcolor=self.colors['success'],
-                             darkcolor=self.colors['success_hover'],
-                             thickness=14,
-                             relief='flat',
-                             bordercolor=self.colors['border'],
-                             foreground=self.colors['success'])
+        if ModernStyleManager._style is None:
+            from tkinter import ttk
+            ModernStyleManager._style = ttk.Style()
 
+        self.colors = color_scheme.get_all_colors()
+        self.style = ModernStyleManager._style
+
+        if not _STYLES_INITIALIZED:
+            available_themes = self.style.theme_names()
+            if 'vista' in available_themes:
+                self.style.theme_use('vista')
+            elif 'winnative' in available_themes:
+                self.style.theme_use('winnative')
+            elif 'clam' in available_themes:
+                self.style.theme_use('clam')
+            else:
+                pass
+
+    def _configure_once(self, name, **options):
+        """Configure a style unless the same options were already applied"""
+        key = (name, tuple(sorted(options.items())))
+        if key in _configured_styles:
+            return
+        _fast_configure(self.style, name, options)
+        _configured_styles.add(key)
+
+    def _apply_style_group(self, group):
+        """Configure and map every style of a table group"""
+        for name, options, state_map in group:
+            self._configure_once(name, **options)
+            if state_map:
+                _fast_map(self.style, name, state_map)
+
+    def _setup_progressbar_extras(self):
+        """Progressbar layout and platform specific tweaks"""
         self.style.layout('Modern.Horizontal.TProgressbar',
                           [('Horizontal.Progressbar.trough',
                            {'children': [('Horizontal.Progressbar.pbar',
                                           {'side': 'left', 'sticky': 'ns'})],
                             'sticky': 'nswe'})])
 
-        self.style.map('Modern.Horizontal.TProgressbar',
-                       background=[('active', self.colors['success']),
-                                   ('pressed', self.colors['success_hover'])])
+        import platform
 
         current_platform = platform.system()
         if current_platform == 'Linux':
-            self.style.configure('Modern.Horizontal.TProgressbar',
+            self._configure_once('Modern.Horizontal.TProgressbar',
                                  pbarrelief='flat',
                                  troughrelief='flat')
-            
+
             try:
                 self.style.element_options('Horizontal.Progressbar.pbar')
-                self.style.configure('Modern.Horizontal.TProgressbar',
+                self._configure_once('Modern.Horizontal.TProgressbar',
                                      pbar=self.colors['success'])
             except tk.TclError:
                 pass  # Some Linux systems don't support this
-        
+
         elif current_platform == 'Darwin':  # macOS
             # macOS might need different styling
-            self.style.configure('Modern.Horizontal.TProgressbar',
+            self._configure_once('Modern.Horizontal.TProgressbar',
                                  focuscolor='none')
-        
-    def _setup_scrollbar_styles(self):
-        """Configure modern scrollbar styles"""
-        self.style.configure('Modern.Vertical.TScrollbar',
-                             background=self.colors['surface'],
-                             troughcolor=self.colors['border_light'],
-                             borderwidth=0,
-                             arrowcolor=self.colors['text_secondary'],
-                             darkcolor=self.colors['border'],
-                             lightcolor=self.colors['card_bg'],
-                             gripcount=0,
-                             relief='flat')
-
-        self.style.map('Modern.Vertical.TScrollbar',
-                       background=[('active', self.colors['border']),
-                                   ('pressed', self.colors['border_strong'])])
-
-        self.style.configure('Modern.Horizontal.TScrollbar',
-                             background=self.colors['surface'],
-                             troughcolor=self.colors['border_light'],
-                             borderwidth=0,
-                             arrowcolor=self.colors['text_secondary'],
-                             darkcolor=self.colors['border'],
-                             lightcolor=self.colors['card_bg'],
-                             gripcount=0,
-                             relief='flat')
-
-        self.style.map('Modern.Horizontal.TScrollbar',
-                       background=[('active', self.colors['border']),
-                                   ('pressed', self.colors['border_strong'])])
+
+    def ensure_style(self, group):
+        """Configure a style group the first time a widget needs it"""
+        if group in _ensured_style_groups:
+            return
+
+        self._apply_style_group(_build_style_table(self.colors)[group])
+        if group == 'progressbar':
+            self._setup_progressbar_extras()
+        _ensured_style_groups.add(group)
 
     def setup_all_styles(self):
-        self._setup_frame_styles()
-        self._setup_label_styles()
-        self._setup_entry_styles()
-        self._setup_treeview_styles()
-        self._setup_radiobutton_styles()
-        self._setup_checkbutton_styles()
-        self._setup_combobox_styles()
-        self._setup_progressbar_styles()
-        self._setup_scrollbar_styles()
-
-        self.style.configure(
+        global _STYLES_INITIALIZED
+        if _STYLES_INITIALIZED:
+            return
+
+        table = _build_style_table(self.colors)
+        for group, styles in table.items():
+            if group not in _LAZY_STYLE_GROUPS:
+                self._apply_style_group(styles)
+                _ensured_style_groups.add(group)
+
+        self._configure_once(
             'TLabel', background=self.colors['bg'], foreground='#1f2328')
 
+        _STYLES_INITIALIZED = True
+
     @staticmethod
     def create_simple_frame(parent, bg_color, border_color=None, padding=10):
         """Create a simple frame with optional border"""
@@ -435,6 +547,234 @@ class ModernStyleManager:
         return container, content_frame
 
 
+# Padding and border a default tk.Label adds around its text on each side
+_LABEL_CHROME = 2
+
+
+@functools.lru_cache(maxsize=1024)
+def _measure_text(text, font_key):
+    """Size a tk.Label would request for text in one of the FONTS"""
+    font = _get_font(font_key)
+    return (font.measure(text) + 2 * _LABEL_CHROME,
+            font.metrics('linespace') + 2 * _LABEL_CHROME)
+
+
+@functools.lru_cache(maxsize=64)
+def _corner_ring_offsets(radius, border_width):
+    """Top-left corner pixels that belong to a rounded border ring"""
+    outer = radius * radius
+    inner = max(radius - border_width, 0) ** 2
+    offsets = []
+    for i in range(radius):
+        for j in range(radius):
+            dx = radius - i
+            dy = radius - j
+            if inner <= dx*dx + dy*dy <= outer:
+                offsets.append((i, j))
+    return tuple(offsets)
+
+
+@functools.lru_cache(maxsize=64)
+def _corner_ring_spans(radius, border_width):
+    """Corner ring pixels merged into (row, first column, end column) runs"""
+    spans = []
+    for i, j in sorted(_corner_ring_offsets(radius, border_width),
+                       key=lambda offset: (offset[1], offset[0])):
+        if spans and spans[-1][0] == j and spans[-1][2] == i:
+            spans[-1][2] = i + 1
+        else:
+            spans.append([j, i, i + 1])
+    return tuple(tuple(span) for span in spans)
+
+
+@functools.lru_cache(maxsize=512)
+def _render_rounded_rect(width, height, radius, fill_color, border_color=None, border_width=0):
+    """Rasterise a rounded rectangle into a PhotoImage, cached per look"""
+    image = tk.PhotoImage(width=width, height=height)
+
+    image.put(fill_color, to=(0, radius, width, height - radius))
+    for j in range(radius):
+        dy = radius - j - 0.5
+        inset = int(round(radius - (radius * radius - dy * dy) ** 0.5))
+        image.put(fill_color, to=(inset, j, width - inset, j + 1))
+        image.put(fill_color, to=(inset, height - j - 1, width - inset, height - j))
+
+    if border_color and border_width > 0:
+        image.put(border_color, to=(radius, 0, width - radius, border_width))
+        image.put(border_color, to=(radius, height - border_width, width - radius, height))
+        image.put(border_color, to=(0, radius, border_width, height - radius))
+        image.put(border_color, to=(width - border_width, radius, width, height - radius))
+
+        bottom = height - 1
+        for j, start, end in _corner_ring_spans(radius, border_width):
+            for y in (j, bottom - j):
+                image.put(border_color, to=(start, y, end, y + 1))
+                image.put(border_color, to=(width - end, y, width - start, y + 1))
+
+    return image
+
+
+_BUTTON_STYLES_CACHE = {}
+
+
+def _button_styles(colors):
+    """create_button styles by type, built once per colors mapping"""
+    cached = _BUTTON_STYLES_CACHE.get(id(colors))
+    if cached is not None and cached[0] is colors:
+        return cached[1]
+
+    button_styles = {
+        "primary": {
+            "bg": colors['accent'],
+            "fg": "white",
+            "hover_bg": colors['accent_hover'],
+            "active_bg": colors['accent_dark'],
+            "border_color": None,
+            "border_width": 0
+        },
+        "success": {
+            "bg": colors['success'],
+            "fg": "white",
+            "hover_bg": colors['success_hover'],
+            "active_bg": colors['success_hover'],
+            "border_color": None,
+            "border_width": 0
+        },
+        "danger": {
+            "bg": colors['danger'],
+            "fg": "white",
+            "hover_bg": colors['danger_hover'],
+            "active_bg": colors['danger_hover'],
+            "border_color": None,
+            "border_width": 0
+        },
+        "info": {
+            "bg": colors['accent_light'],
+            "fg": colors['accent'],
+            "hover_bg": colors['accent_light'],
+            "active_bg": colors['accent_light'],
+            "border_color": colors['accent'],
+            "border_width": 1
+        },
+        "secondary": {
+            "bg": colors['card_bg'],
+            "fg": colors['button_border'],
+            "hover_bg": colors['surface'],
+            "active_bg": colors['border_light'],
+            "border_color": colors['button_border'],
+            "border_width": 2
+        }
+    }
+
+    _BUTTON_STYLES_CACHE[id(colors)] = (colors, button_styles)
+    return button_styles
+
+
+_ICON_BUTTON_STYLE = MappingProxyType({
+    "bg": None,
+    "fg": None,
+    "hover_bg": None,
+    "active_bg": None,
+    "border_color": None,
+    "border_width": 0
+})
+
+_IMAGE_BUTTON_STYLES_CACHE = {}
+
+
+def _image_button_styles(colors):
+    """create_image_button styles by type, built once per colors mapping"""
+    cached = _IMAGE_BUTTON_STYLES_CACHE.get(id(colors))
+    if cached is not None and cached[0] is colors:
+        return cached[1]
+
+    # Same looks as create_button, minus "info" and plus the bare icon style
+    shared = _button_styles(colors)
+    button_styles = {name: shared[name]
+                     for name in ("primary", "secondary", "success", "danger")}
+    button_styles["icon"] = _ICON_BUTTON_STYLE
+
+    _IMAGE_BUTTON_STYLES_CACHE[id(colors)] = (colors, button_styles)
+    return button_styles
+
+
+def _restore_hover(canvas, bg_item, text_item, image, fg):
+    """Put a clicked button back into its hover look"""
+    canvas.itemconfig(bg_item, image=image)
+    canvas.itemconfig(text_item, fill=fg)
+
+
+@functools.lru_cache(maxsize=16)
+def _text_fg_for_bg(success, danger, accent, border_light, text_muted):
+    """Text color to use on each themed button background"""
+    # Later entries win, matching the precedence of the old if/elif chain
+    return MappingProxyType({
+        border_light: text_muted,
+        accent: 'white',
+        danger: 'white',
+        success: 'white',
+    })
+
+
+class _ButtonShim:
+    """config/cget stand-in for canvas drawn buttons"""
+
+    __slots__ = ('canvas', 'text_item', 'redraw', 'style', 'colors',
+                 'button_type', 'disabled', 'fg_for_bg')
+
+    def __init__(self, canvas, text_item, redraw, style, colors, button_type):
+        self.canvas = canvas
+        self.text_item = text_item
+        self.redraw = redraw
+        self.style = style
+        self.colors = colors
+        self.button_type = button_type
+        self.disabled = False
+        self.fg_for_bg = _text_fg_for_bg(colors['success'], colors['danger'],
+                                         colors['accent'], colors['border_light'],
+                                         colors['text_muted'])
+
+    def configure(self, state=None, bg=None, fg=None, cursor=None, **kwargs):
+        canvas = self.canvas
+        text_item = self.text_item
+        style = self.style
+        colors = self.colors
+
+        if state is not None:
+            self.disabled = (state == tk.DISABLED)
+            if self.disabled:
+                self.redraw(colors['border_light'], None, 0)
+                canvas.itemconfig(text_item, fill=colors['text_muted'])
+                canvas.configure(cursor='arrow')
+            else:
+                self.redraw(style["bg"], style.get("border_color"),
+                            style.get("border_width", 0))
+                canvas.itemconfig(text_item, fill=style["fg"])
+                canvas.configure(cursor='hand2')
+
+        if bg is not None:
+            if not self.disabled:
+                border_color = style.get(
+                    "border_color") if self.button_type == "secondary" else None
+                border_width = style.get(
+                    "border_width", 0) if self.button_type == "secondary" else 0
+
+                self.redraw(bg, border_color, border_width)
+                canvas.itemconfig(text_item, fill=self.fg_for_bg.get(bg, style["fg"]))
+
+        if fg is not None:
+            if not self.disabled:
+                canvas.itemconfig(text_item, fill=fg)
+
+        if cursor is not None:
+            canvas.configure(cursor=cursor)
+
+    def cget(self, option):
+        if option == 'state':
+            return tk.DISABLED if self.disabled else tk.NORMAL
+        return None
+
+
 class UIHelpers:
     """Helper functions for UI creation"""
 
@@ -443,48 +783,7 @@ class UIHelpers:
         if colors is None:
             return None
 
-        button_styles = {
-            "primary": {
-                "bg": colors['accent'],
-                "fg": "white",
-                "hover_bg": colors['accent_hover'],
-                "active_bg": colors['accent_dark'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "success": {
-                "bg": colors['success'],
-                "fg": "white",
-                "hover_bg": colors['success_hover'],
-                "active_bg": colors['success_hover'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "danger": {
-                "bg": colors['danger'],
-                "fg": "white",
-                "hover_bg": colors['danger_hover'],
-                "active_bg": colors['danger_hover'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "info": {
-                "bg": colors['accent_light'],
-                "fg": colors['accent'],
-                "hover_bg": colors['accent_light'],
-                "active_bg": colors['accent_light'],
-                "border_color": colors['accent'],
-                "border_width": 1
-            },
-            "secondary": {
-                "bg": colors['card_bg'],
-                "fg": colors['button_border'],
-                "hover_bg": colors['surface'],
-                "active_bg": colors['border_light'],
-                "border_color": colors['button_border'],
-                "border_width": 2
-            }
-        }
+        button_styles = _button_styles(colors)
 
         style = button_styles.get(button_type, button_styles["primary"])
 
@@ -501,12 +800,7 @@ class UIHelpers:
         canvas = tk.Canvas(container, highlightthickness=0,
                            bg=parent_bg, cursor='hand2')
 
-        temp_label = tk.Label(container, text=text,
-                              font=('Segoe UI', 10, 'bold'))
-        temp_label.update_idletasks()
-        text_width = temp_label.winfo_reqwidth()
-        text_height = temp_label.winfo_reqheight()
-        temp_label.destroy()
+        text_width, text_height = _measure_text(text, 'button')
 
         button_width = text_width + (padx * 2)
         button_height = text_height + (pady * 2)
@@ -514,117 +808,46 @@ class UIHelpers:
 
         canvas.configure(width=button_width, height=button_height)
 
-        def draw_rounded_rect(canvas, x1, y1, x2, y2, radius, fill_color, border_color=None, border_width=0):
-            canvas.delete("button_bg")
-            canvas.delete("button_border")
-
-            canvas.create_rectangle(x1 + radius, y1, x2 - radius, y2,
-                                    fill=fill_color, outline="", tags="button_bg")
-            canvas.create_rectangle(x1, y1 + radius, x2, y2 - radius,
-                                    fill=fill_color, outline="", tags="button_bg")
-
-            canvas.create_arc(x1, y1, x1 + 2*radius, y1 + 2*radius,
-                              start=90, extent=90, fill=fill_color, outline="", tags="button_bg")
-            canvas.create_arc(x2 - 2*radius, y1, x2, y1 + 2*radius,
-                              start=0, extent=90, fill=fill_color, outline="", tags="button_bg")
-            canvas.create_arc(x1, y2 - 2*radius, x1 + 2*radius, y2,
-                              start=180, extent=90, fill=fill_color, outline="", tags="button_bg")
-            canvas.create_arc(x2 - 2*radius, y2 - 2*radius, x2, y2,
-                              start=270, extent=90, fill=fill_color, outline="", tags="button_bg")
-
-            if border_color and border_width > 0:
-                canvas.create_rectangle(x1 + radius, y1, x2 - radius, y1 + border_width,
-                                        fill=border_color, outline="", tags="button_border")
-                canvas.create_rectangle(x1 + radius, y2 - border_width, x2 - radius, y2,
-                                        fill=border_color, outline="", tags="button_border")
-                canvas.create_rectangle(x1, y1 + radius, x1 + border_width, y2 - radius,
-                                        fill=border_color, outline="", tags="button_border")
-                canvas.create_rectangle(x2 - border_width, y1 + radius, x2, y2 - radius,
-                                        fill=border_color, outline="", tags="button_border")
-
-                corner_size = radius
-
-                for i in range(corner_size):
-                    for j in range(corner_size):
-                        dx = corner_size - i
-                        dy = corner_size - j
-                        distance = (dx*dx + dy*dy) ** 0.5
-
-                        if corner_size - border_width <= distance <= corner_size:
-                            canvas.create_rectangle(x1 + i, y1 + j, x1 + i + 1, y1 + j + 1,
-                                                    fill=border_color, outline="", tags="button_border")
-
-                for i in range(corner_size):
-                    for j in range(corner_size):
-                        dx = i + 1
-                        dy = corner_size - j
-                        distance = (dx*dx + dy*dy) ** 0.5
-
-                        if corner_size - border_width <= distance <= corner_size:
-                            canvas.create_rectangle(x2 - corner_size + i, y1 + j, x2 - corner_size + i + 1, y1 + j + 1,
-                                                    fill=border_color, outline="", tags="button_border")
-
-                for i in range(corner_size):
-                    for j in range(corner_size):
-                        dx = corner_size - i
-                        dy = j + 1
-                        distance = (dx*dx + dy*dy) ** 0.5
-
-                        if corner_size - border_width <= distance <= corner_size:
-                            canvas.create_rectangle(x1 + i, y2 - corner_size + j, x1 + i + 1, y2 - corner_size + j + 1,
-                                                    fill=border_color, outline="", tags="button_border")
-
-                for i in range(corner_size):
-                    for j in range(corner_size):
-                        dx = i + 1
-                        dy = j + 1
-                        distance = (dx*dx + dy*dy) ** 0.5
-
-                        if corner_size - border_width <= distance <= corner_size:
-                            canvas.create_rectangle(x2 - corner_size + i, y2 - corner_size + j,
-                                                    x2 - corner_size + i + 1, y2 - corner_size + j + 1,
-                                                    fill=border_color, outline="", tags="button_border")
-
-            canvas.tag_raise("button_text")
-
-        draw_rounded_rect(canvas, 0, 0, button_width,
-                          button_height, corner_radius, style["bg"],
-                          style.get("border_color"), style.get("border_width", 0))
+        bg_item = canvas.create_image(0, 0, anchor='nw', tags="button_bg")
+
+        # The canvas only holds the Tk image name, so the images in use are kept here;
+        # an image evicted from the lru_cache would otherwise be deleted while shown
+        shown_images = {}
+
+        def redraw(fill_color, border_color=None, border_width=0):
+            image = _render_rounded_rect(button_width, button_height, corner_radius,
+                                         fill_color, border_color, border_width)
+            shown_images["bg"] = image
+            canvas.itemconfig(bg_item, image=image)
+
+        redraw(style["bg"], style.get("border_color"), style.get("border_width", 0))
 
         text_item = canvas.create_text(button_width//2, button_height//2,
                                        text=text, fill=style["fg"],
-                                       font=('Segoe UI', 10, 'bold'), tags="button_text")
-
-        canvas.tag_raise("button_text")
+                                       font=_get_font('button'), tags="button_text")
 
-        button_state = {"disabled": False}
+        button_state = _ButtonShim(canvas, text_item, redraw, style, colors, button_type)
 
         def on_enter(e):
-            if not button_state["disabled"]:
-                draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                  corner_radius, style["hover_bg"],
-                                  style.get("border_color"), style.get("border_width", 0))
+            if not button_state.disabled:
+                redraw(style["hover_bg"], style.get("border_color"), style.get("border_width", 0))
                 canvas.itemconfig(text_item, fill=style["fg"])
 
         def on_leave(e):
-            if not button_state["disabled"]:
-                draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                  corner_radius, style["bg"],
-                                  style.get("border_color"), style.get("border_width", 0))
+            if not button_state.disabled:
+                redraw(style["bg"], style.get("border_color"), style.get("border_width", 0))
                 canvas.itemconfig(text_item, fill=style["fg"])
 
         def on_click(e):
-            if not button_state["disabled"]:
-                draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                  corner_radius, style["active_bg"],
-                                  style.get("border_color"), style.get("border_width", 0))
+            if not button_state.disabled:
+                redraw(style["active_bg"], style.get("border_color"), style.get("border_width", 0))
                 canvas.itemconfig(text_item, fill=style["fg"])
-                parent.after(100, lambda: [
-                    draw_rounded_rect(
-                        canvas, 0, 0, button_width, button_height, corner_radius, style["hover_bg"],
-                        style.get("border_color"), style.get("border_width", 0)),
-                    canvas.itemconfig(text_item, fill=style["fg"])
-                ])
+                hover_image = _render_rounded_rect(
+                    button_width, button_height, corner_radius, style["hover_bg"],
+                    style.get("border_color"), style.get("border_width", 0))
+                shown_images["hover"] = hover_image
+                parent.after(100, _restore_hover, canvas, bg_item, text_item,
+                             hover_image, style["fg"])
                 if command:
                     command()
 
@@ -634,78 +857,16 @@ class UIHelpers:
 
         canvas.pack()
 
-        def config_wrapper(state=None, bg=None, fg=None, cursor=None, **kwargs):
-            if state is not None:
-                button_state["disabled"] = (state == tk.DISABLED)
-                if button_state["disabled"]:
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, colors['border_light'],
-                                      None, 0)
-                    canvas.itemconfig(text_item, fill=colors['text_muted'])
-                    canvas.configure(cursor='arrow')
-                else:
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, style["bg"],
-                                      style.get("border_color"), style.get("border_width", 0))
-                    canvas.itemconfig(text_item, fill=style["fg"])
-                    canvas.configure(cursor='hand2')
-
-                canvas.tag_raise("button_text")
-
-            if bg is not None:
-                if not button_state["disabled"]:
-                    color_map = {
-                        colors['border_light']: colors['border_light'],
-                        colors['success']: colors['success'],
-                        colors['danger']: colors['danger'],
-                        colors['accent']: colors['accent']
-                    }
-
-                    mapped_color = color_map.get(bg, bg)
-
-                    border_color = style.get(
-                        "border_color") if button_type == "secondary" else None
-                    border_width = style.get(
-                        "border_width", 0) if button_type == "secondary" else 0
-
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, mapped_color, border_color, border_width)
-                    if bg == colors['success']:
-                        canvas.itemconfig(text_item, fill='white')
-                    elif bg == colors['danger']:
-                        canvas.itemconfig(text_item, fill='white')
-                    elif bg == colors['accent']:
-                        canvas.itemconfig(text_item, fill='white')
-                    elif bg == colors['border_light']:
-                        canvas.itemconfig(text_item, fill=colors['text_muted'])
-                    else:
-                        canvas.itemconfig(text_item, fill=style["fg"])
-
-                    canvas.tag_raise("button_text")
-
-            if fg is not None:
-                if not button_state["disabled"]:
-                    canvas.itemconfig(text_item, fill=fg)
-                    canvas.tag_raise("button_text")
-
-            if cursor is not None:
-                canvas.configure(cursor=cursor)
-
-        def cget_wrapper(option):
-            if option == 'state':
-                return tk.DISABLED if button_state["disabled"] else tk.NORMAL
-            return None
-
-        setattr(container, 'config', config_wrapper)
-        setattr(container, 'configure', config_wrapper)
-        setattr(container, 'cget', cget_wrapper)
-        container['state'] = tk.NORMAL
+        setattr(container, 'config', button_state.configure)
+        setattr(container, 'configure', button_state.configure)
+        setattr(container, 'cget', button_state.cget)
 
         return container
 
     @staticmethod
     def create_labelframe(parent, text, colors, padding=15):
         """Create a simple label frame to replace ttk.LabelFrame"""
+        from tkinter import ttk
 
         frame = ttk.LabelFrame(
             parent, text=text, style='Modern.TLabelframe', padding=padding)
@@ -713,70 +874,46 @@ class UIHelpers:
 
     @staticmethod
     def create_hover_effect(widget, colors, enter_color, leave_color):
-        def on_enter(e):
-            widget.config(bg=enter_color)
-
-        def on_leave(e):
-            widget.config(bg=leave_color)
-
-        widget.bind('<Enter>', on_enter)
-        widget.bind('<Leave>', on_leave)
+        # Bound as Tcl scripts so pointer crossings never enter Python
+        _ensure_hover_proc(widget)
+        widget.bind('<Enter>', '%s %%W {%s}' % (_HOVER_PROC, enter_color))
+        widget.bind('<Leave>', '%s %%W {%s}' % (_HOVER_PROC, leave_color))
 
     @staticmethod
     def create_drop_zone_hover(drop_zone, child_widgets, colors):
         original_bg = drop_zone.cget('bg')
-        original_child_bgs = []
-
-        for child in child_widgets:
-            original_child_bgs.append(child.cget('bg'))
+        hover_bg = colors['drop_zone_hover']
+        child_setters = tuple((child.config, child.cget('bg'))
+                              for child in child_widgets)
 
+        # Only the background changes; Tk keeps relief, border and size as they are
         def on_enter(e):
-            current_relief = drop_zone.cget('relief')
-            current_bd = drop_zone.cget('bd')
-            current_height = drop_zone.cget('height')
-            current_width = drop_zone.cget('width')
-
-            drop_zone.config(bg=colors['drop_zone_hover'],
-                             relief=current_relief, bd=current_bd,
-                             height=current_height, width=current_width)
+            drop_zone.config(bg=hover_bg)
 
-            for i, child in enumerate(child_widgets):
-                child.config(bg=colors['drop_zone_hover'])
+            for setter, _ in child_setters:
+                setter(bg=hover_bg)
 
         def on_leave(e):
-            current_relief = drop_zone.cget('relief')
-            current_bd = drop_zone.cget('bd')
-            current_height = drop_zone.cget('height')
-            current_width = drop_zone.cget('width')
+            drop_zone.config(bg=original_bg)
 
-            drop_zone.config(bg=original_bg,
-                             relief=current_relief, bd=current_bd,
-                             height=current_height, width=current_width)
-
-            for i, child in enumerate(child_widgets):
-                child.config(bg=original_child_bgs[i])
+            for setter, child_bg in child_setters:
+                setter(bg=child_bg)
 
         drop_zone.bind('<Enter>', on_enter)
         drop_zone.bind('<Leave>', on_leave)
-        drop_zone.bind('<FocusIn>', lambda e: "break")
-        drop_zone.bind('<FocusOut>', lambda e: "break")
-        drop_zone.bind('<Button-1>', lambda e: "break")
-        drop_zone.bind('<ButtonRelease-1>', lambda e: "break")
+
+        _ensure_drop_zone_bindtag(drop_zone)
+        tags = drop_zone.bindtags()
+        drop_zone.bindtags(tags[:1] + (_DROP_ZONE_TAG,) + tags[1:])
 
         drop_zone.configure(takefocus=False)
 
     @staticmethod
     def create_status_frame(parent, colors, status_type="info"):
         """Status frame with appropriate colors for different message types"""
-        status_colors = {
-            'info': colors['accent_light'],
-            'success': colors['success_light'],
-            'danger': colors['danger_light'],
-            'error': colors['danger']
-        }
+        bg = colors[_STATUS_COLOR_KEYS.get(status_type, 'accent_light')]
 
-        frame = tk.Frame(parent, bg=status_colors.get(status_type, colors['accent_light']),
-                         relief='solid', bd=1, highlightthickness=0)
+        frame = tk.Frame(parent, bg=bg, relief='solid', bd=1, highlightthickness=0)
         return frame
 
     @staticmethod
@@ -790,48 +927,7 @@ class UIHelpers:
             if has_images and icon_func:
                 image = icon_func(icon_type, is_light=is_light)
 
-        button_styles = {
-            "primary": {
-                "bg": colors['accent'],
-                "fg": "white",
-                "hover_bg": colors['accent_hover'],
-                "active_bg": colors['accent_dark'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "secondary": {
-                "bg": colors['card_bg'],
-                "fg": colors['button_border'],
-                "hover_bg": colors['surface'],
-                "active_bg": colors['border_light'],
-                "border_color": colors['button_border'],
-                "border_width": 2
-            },
-            "success": {
-                "bg": colors['success'],
-                "fg": "white",
-                "hover_bg": colors['success_hover'],
-                "active_bg": colors['success_hover'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "danger": {
-                "bg": colors['danger'],
-                "fg": "white",
-                "hover_bg": colors['danger_hover'],
-                "active_bg": colors['danger_hover'],
-                "border_color": None,
-                "border_width": 0
-            },
-            "icon": {
-                "bg": None,
-                "fg": None,
-                "hover_bg": None,
-                "active_bg": None,
-                "border_color": None,
-                "border_width": 0
-            }
-        }
+        button_styles = _image_button_styles(colors)
 
         style = button_styles.get(button_type, button_styles["primary"])
 
@@ -842,17 +938,14 @@ class UIHelpers:
             parent_bg = parent.cget('bg')
         except:
             parent_bg = colors['bg']
+        text_color = colors['text']
+        button_font = _get_font('button')
 
         container = tk.Frame(parent, bg=parent_bg)
         canvas = tk.Canvas(container, highlightthickness=0,
                            bg=parent_bg, cursor='hand2')
 
-        temp_label = tk.Label(container, text=text,
-                              font=('Segoe UI', 10, 'bold'))
-        temp_label.update_idletasks()
-        text_width = temp_label.winfo_reqwidth()
-        text_height = temp_label.winfo_reqheight()
-        temp_label.destroy()
+        text_width, text_height = _measure_text(text, 'button')
 
         image_width = 16 if image else 0
         image_padding = 5 if image else 0
@@ -864,10 +957,7 @@ class UIHelpers:
         canvas.configure(width=button_width, height=button_height)
 
         def draw_rounded_rect(canvas, x1, y1, x2, y2, radius, fill_color, border_color=None, border_width=0):
-            canvas.delete("button_bg")
-            canvas.delete("button_border")
-            canvas.delete("button_text")
-            canvas.delete("button_image")
+            canvas.delete("button_all")
 
             if button_type == "icon":
                 content_x = button_width // 2
@@ -880,86 +970,24 @@ class UIHelpers:
                         text_x = image_x + image_width // 2 + image_padding + text_width // 2
 
                         canvas.create_image(
-                            image_x, button_height // 2, image=image, tags="button_image")
-                        canvas.create_text(text_x, button_height // 2, text=text, fill=colors['text'],
-                                           font=('Segoe UI', 10, 'bold'), tags="button_text")
+                            image_x, button_height // 2, image=image, tags=("button_image", "button_all"))
+                        canvas.create_text(text_x, button_height // 2, text=text, fill=text_color,
+                                           font=button_font, tags=("button_text", "button_all"))
                     else:
                         canvas.create_image(
-                            content_x, button_height // 2, image=image, tags="button_image")
+                            content_x, button_height // 2, image=image, tags=("button_image", "button_all"))
                 elif text and text.strip():
-                    canvas.create_text(content_x, button_height // 2, text=text, fill=colors['text'],
-                                       font=('Segoe UI', 10, 'bold'), tags="button_text")
-                return
+                    canvas.create_text(content_x, button_height // 2, text=text, fill=text_color,
+                                       font=button_font, tags=("button_text", "button_all"))
+                return None
 
+            # Fill and border are one image item; the border ring is part of the raster
+            bg_item = None
             if fill_color:
-                canvas.create_rectangle(x1 + radius, y1, x2 - radius, y2,
-                                        fill=fill_color, outline="", tags="button_bg")
-                canvas.create_rectangle(x1, y1 + radius, x2, y2 - radius,
-                                        fill=fill_color, outline="", tags="button_bg")
-
-                canvas.create_arc(x1, y1, x1 + 2*radius, y1 + 2*radius,
-                                  start=90, extent=90, fill=fill_color, outline="", tags="button_bg")
-                canvas.create_arc(x2 - 2*radius, y1, x2, y1 + 2*radius,
-                                  start=0, extent=90, fill=fill_color, outline="", tags="button_bg")
-                canvas.create_arc(x1, y2 - 2*radius, x1 + 2*radius, y2,
-                                  start=180, extent=90, fill=fill_color, outline="", tags="button_bg")
-                canvas.create_arc(x2 - 2*radius, y2 - 2*radius, x2, y2,
-                                  start=270, extent=90, fill=fill_color, outline="", tags="button_bg")
-
-            if border_color and border_width > 0:
-                if button_type == "secondary":
-                    canvas.create_rectangle(x1 + radius, y1, x2 - radius, y1 + border_width,
-                                            fill=border_color, outline="", tags="button_border")
-                    canvas.create_rectangle(x1 + radius, y2 - border_width, x2 - radius, y2,
-                                            fill=border_color, outline="", tags="button_border")
-                    canvas.create_rectangle(x1, y1 + radius, x1 + border_width, y2 - radius,
-                                            fill=border_color, outline="", tags="button_border")
-                    canvas.create_rectangle(x2 - border_width, y1 + radius, x2, y2 - radius,
-                                            fill=border_color, outline="", tags="button_border")
-
-                    corner_size = radius
-                    for i in range(corner_size):
-                        for j in range(corner_size):
-                            dx = corner_size - i
-                            dy = corner_size - j
-                            distance = (dx*dx + dy*dy) ** 0.5
-
-                            if corner_size - border_width <= distance <= corner_size:
-                                canvas.create_rectangle(x1 + i, y1 + j, x1 + i + 1, y1 + j + 1,
-                                                        fill=border_color, outline="", tags="button_border")
-
-                    for i in range(corner_size):
-                        for j in range(corner_size):
-                            dx = i + 1
-                            dy = corner_size - j
-                            distance = (dx*dx + dy*dy) ** 0.5
-
-                            if corner_size - border_width <= distance <= corner_size:
-                                canvas.create_rectangle(x2 - corner_size + i, y1 + j, x2 - corner_size + i + 1, y1 + j + 1,
-                                                        fill=border_color, outline="", tags="button_border")
-
-                    for i in range(corner_size):
-                        for j in range(corner_size):
-                            dx = corner_size - i
-                            dy = j + 1
-                            distance = (dx*dx + dy*dy) ** 0.5
-
-                            if corner_size - border_width <= distance <= corner_size:
-                                canvas.create_rectangle(x1 + i, y2 - corner_size + j, x1 + i + 1, y2 - corner_size + j + 1,
-                                                        fill=border_color, outline="", tags="button_border")
-
-                    for i in range(corner_size):
-                        for j in range(corner_size):
-                            dx = i + 1
-                            dy = j + 1
-                            distance = (dx*dx + dy*dy) ** 0.5
-                            if corner_size - border_width <= distance <= corner_size:
-                                canvas.create_rectangle(x2 - corner_size + i, y2 - corner_size + j,
-                                                        x2 - corner_size + i + 1, y2 - corner_size + j + 1,
-                                                        fill=border_color, outline="", tags="button_border")
-                else:
-                    canvas.create_rectangle(x1, y1, x2, y2, outline=border_color,
-                                            width=border_width, tags="button_border")
+                bg_item = canvas.create_image(x1, y1, anchor='nw', tags=("button_bg", "button_all"),
+                                              image=_render_rounded_rect(
+                                                  x2 - x1, y2 - y1, radius, fill_color,
+                                                  border_color, border_width))
 
             content_x = button_width // 2
             if image:
@@ -970,56 +998,74 @@ class UIHelpers:
                     text_x = image_x + image_width // 2 + image_padding + text_width // 2
 
                     canvas.create_image(
-                        image_x, button_height // 2, image=image, tags="button_image")
+                        image_x, button_height // 2, image=image, tags=("button_image", "button_all"))
                     canvas.create_text(text_x, button_height // 2, text=text, fill=style["fg"],
-                                       font=('Segoe UI', 10, 'bold'), tags="button_text")
+                                       font=button_font, tags=("button_text", "button_all"))
                 else:
                     canvas.create_image(
-                        content_x, button_height // 2, image=image, tags="button_image")
+                        content_x, button_height // 2, image=image, tags=("button_image", "button_all"))
 
             elif text and text.strip():
                 canvas.create_text(content_x, button_height // 2, text=text, fill=style["fg"],
-                                   font=('Segoe UI', 10, 'bold'), tags="button_text")
+                                   font=button_font, tags=("button_text", "button_all"))
+
+            return bg_item
+
+        bg_item = None
 
-        draw_rounded_rect(canvas, 0, 0, button_width, button_height, corner_radius,
-                          style["bg"], style.get("border_color"), style.get("border_width", 0))
+        # The first draw waits until the canvas is actually on screen
+        def on_map(e):
+            nonlocal bg_item
+            canvas.unbind('<Map>', map_binding)
+            bg_item = draw_rounded_rect(canvas, 0, 0, button_width, button_height, corner_radius,
+                                        style["bg"], style.get("border_color"), style.get("border_width", 0))
+
+        map_binding = canvas.bind('<Map>', on_map)
+
+        ring_color = style.get("border_color")
+        ring_width = style.get("border_width", 0)
+
+        # Every background look is rendered up front; state changes only swap images
+        bg_images = {}
+        if button_type != "icon":
+            for state, key in (("normal", "bg"), ("hover", "hover_bg"), ("active", "active_bg")):
+                bg_images[state] = _render_rounded_rect(
+                    button_width, button_height, corner_radius,
+                    style[key], ring_color, ring_width)
+
+        def set_fill(state):
+            # Icon buttons never draw a background, so only others recolor
+            if bg_item is not None:
+                canvas.itemconfig(bg_item, image=bg_images[state])
+
+        # Bursts of pointer events collapse into one image swap per idle cycle
+        pending_state = [None]
+
+        def flush_fill():
+            state = pending_state[0]
+            pending_state[0] = None
+            if state is not None:
+                set_fill(state)
+
+        def request_fill(state):
+            if pending_state[0] is None:
+                canvas.after_idle(flush_fill)
+            pending_state[0] = state
 
         button_state = {"disabled": False}
 
         def on_enter(e):
             if not button_state["disabled"]:
-                if button_type == "icon":
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, colors['border_light'], None, 0)
-                else:
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, style["hover_bg"],
-                                      style.get("border_color"), style.get("border_width", 0))
+                request_fill("hover")
 
         def on_leave(e):
             if not button_state["disabled"]:
-                if button_type == "icon":
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, None, None, 0)
-                else:
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, style["bg"],
-                                      style.get("border_color"), style.get("border_width", 0))
+                request_fill("normal")
 
         def on_click(e):
             if not button_state["disabled"]:
-                if button_type == "icon":
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, colors['border'], None, 0)
-                    parent.after(100, lambda: draw_rounded_rect(
-                        canvas, 0, 0, button_width, button_height, corner_radius, colors['border_light'], None, 0))
-                else:
-                    draw_rounded_rect(canvas, 0, 0, button_width, button_height,
-                                      corner_radius, style["active_bg"],
-                                      style.get("border_color"), style.get("border_width", 0))
-                    parent.after(100, lambda: draw_rounded_rect(
-                        canvas, 0, 0, button_width, button_height, corner_radius, style["hover_bg"],
-                        style.get("border_color"), style.get("border_width", 0)))
+                request_fill("active")
+                parent.after(100, request_fill, "hover")
                 if command:
                     command()
 
@@ -1034,6 +1080,7 @@ class UIHelpers:
     def create_progress_bar(parent, colors=None, **kwargs):
         """Create a cross-platform progress bar with consistent styling"""
         if colors is None:
+            from tkinter import ttk
             return ttk.Progressbar(parent, mode='determinate', **kwargs)
         
         class CustomProgressBar:
@@ -1052,36 +1099,45 @@ class UIHelpers:
                 self.current_value = 0
                 self.colors = colors
                 
-                self.canvas.bind('<Configure>', self._on_canvas_resize)
+                # Items are created once and only moved; size comes from <Configure>
+                self._canvas_width = 0
+                self._canvas_height = 0
+                self._trough = self.canvas.create_rectangle(
+                    0, 0, 0, 0, state='hidden',
+                    fill=colors.get('border_light', '#f0f0f0'),
+                    outline=colors.get('border', '#cccccc'),
+                    tags='trough')
+                self._progress = self.canvas.create_rectangle(
+                    0, 0, 0, 0, state='hidden',
+                    fill=colors.get('success', '#1a7f37'),
+                    outline='',
+                    tags='progress')
                 
-                self.container.after(10, self._draw_progress_bar)
+                self.canvas.bind('<Configure>', self._on_canvas_resize)
             
             def _on_canvas_resize(self, event):
                 """Redraw progress bar when canvas is resized"""
+                self._canvas_width = event.width
+                self._canvas_height = event.height
                 self._draw_progress_bar()
             
             def _draw_progress_bar(self):
                 """Draw the progress bar based on current canvas size"""
-                self.canvas.delete('all')
-                
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
+                canvas_width = self._canvas_width
+                canvas_height = self._canvas_height
                 
                 if canvas_width <= 1 or canvas_height <= 1:
                     return
                 
-                self.canvas.create_rectangle(2, 2, canvas_width-2, canvas_height-2,
-                                           fill=self.colors.get('border_light', '#f0f0f0'),
-                                           outline=self.colors.get('border', '#cccccc'),
-                                           tags='trough')
+                self.canvas.coords(self._trough, 2, 2, canvas_width-2, canvas_height-2)
+                self.canvas.itemconfig(self._trough, state='normal')
                 
                 if self.current_value > 0:
                     progress_width = max(2, (self.current_value / 100.0) * (canvas_width - 4))
-                    self.canvas.create_rectangle(2, 2, progress_width + 2, canvas_height - 2,
-                                               fill=self.colors.get('success', '#1a7f37'),
-                                               outline='',
-                                               tags='progress')
+                    self.canvas.coords(self._progress, 2, 2, progress_width + 2, canvas_height - 2)
+                    self.canvas.itemconfig(self._progress, state='normal')
+                else:
+                    self.canvas.itemconfig(self._progress, state='hidden')
             
             def config(self, value=None, **kwargs):
                 if value is not None:
@@ -1107,23 +1163,60 @@ class UIHelpers:
         return CustomProgressBar(parent, colors, **kwargs)
 
 
-FONTS = {
-    'title': ('Segoe UI', 28, 'bold'),
-    'subtitle': ('Segoe UI', 13),
-    'heading': ('Segoe UI', 12, 'bold'),
-    'body': ('Segoe UI', 10),
-    'body_bold': ('Segoe UI', 10, 'bold'),
-    'small': ('Segoe UI', 9),
-    'small_bold': ('Segoe UI', 9, 'bold'),
-    'large_icon': ('Segoe UI', 24),
-    'medium_icon': ('Segoe UI', 20),
-    'small_icon': ('Segoe UI', 16),
-    'button': ('Segoe UI', 10, 'bold'),
-    'label': ('Segoe UI', 10),
-    'status': ('Segoe UI', 9)
-}
-
-LAYOUT = {
+_FONT_FAMILY = sys.intern('Segoe UI')
+
+FONTS = MappingProxyType({
+    'title': (_FONT_FAMILY, 28, 'bold'),
+    'subtitle': (_FONT_FAMILY, 13),
+    'heading': (_FONT_FAMILY, 12, 'bold'),
+    'body': (_FONT_FAMILY, 10),
+    'body_bold': (_FONT_FAMILY, 10, 'bold'),
+    'small': (_FONT_FAMILY, 9),
+    'small_bold': (_FONT_FAMILY, 9, 'bold'),
+    'large_icon': (_FONT_FAMILY, 24),
+    'medium_icon': (_FONT_FAMILY, 20),
+    'small_icon': (_FONT_FAMILY, 16),
+    'button': (_FONT_FAMILY, 10, 'bold'),
+    'label': (_FONT_FAMILY, 10),
+    'status': (_FONT_FAMILY, 9)
+})
+
+FONT_NAMES = MappingProxyType({key: 'mkv.' + key for key in FONTS})
+
+
+# Font objects are kept alive here; a collected tkfont.Font deletes its named font
+_FONT_OBJECTS = {}
+
+
+def create_named_fonts(root=None):
+    """Register every FONTS entry as a named Tk font on the given root"""
+    if _FONT_OBJECTS:
+        return
+    existing = set(tkfont.names(root))
+    for key, spec in FONTS.items():
+        name = FONT_NAMES[key]
+        if name in existing:
+            _FONT_OBJECTS[key] = tkfont.Font(root, name=name, exists=True)
+            continue
+        options = {'family': spec[0], 'size': spec[1]}
+        for modifier in spec[2:]:
+            if modifier in ('bold', 'normal'):
+                options['weight'] = modifier
+            elif modifier in ('italic', 'roman'):
+                options['slant'] = modifier
+        _FONT_OBJECTS[key] = tkfont.Font(root, name=name, **options)
+
+
+def _get_font(key):
+    """Shared named font for a FONTS key, registering the set on first use"""
+    try:
+        return _FONT_OBJECTS[key]
+    except KeyError:
+        create_named_fonts()
+        return _FONT_OBJECTS[key]
+
+
+LAYOUT = MappingProxyType({
     'main_padding': 20,
     'card_padding': 20,
     'section_spacing': 20,
@@ -1136,4 +1229,4 @@ LAYOUT = {
     'tree_height': 8,
     'card_border_radius': 8,
     'button_border_radius': 6
-}
+})
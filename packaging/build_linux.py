@@ -10,14 +10,70 @@ import subprocess
 import platform
 import shutil
 from pathlib import Path
-import tempfile
 import urllib.request
+import urllib.error
+from email.utils import formatdate
 import stat
 import importlib.util
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ASSETS = PROJECT_ROOT / "assets"
+
+
+# PyInstaller options that do not change between builds
+_PYI_BASE_ARGS = (
+    "--onefile",
+    "--windowed",
+    "--add-data=core:core",
+    "--add-data=desktop:desktop",
+    "--add-data=assets:assets",  # Include assets folder for runtime access
+    "--hidden-import=tkinter",
+    "--hidden-import=tkinter.ttk",
+    "--hidden-import=tkinter.filedialog",
+    "--hidden-import=tkinter.messagebox",
+    "--hidden-import=tkinter.font",
+    "--hidden-import=tkinterdnd2",
+    "--hidden-import=PIL",
+    "--hidden-import=PIL.Image",
+    "--hidden-import=PIL.ImageTk",
+    "--hidden-import=PIL.ImageOps",
+    # Only the Pillow modules the GUI imports; --collect-all=PIL pulled in the whole package
+    "--collect-submodules=PIL.Image",
+    "--collect-submodules=PIL.ImageTk",
+    "--collect-submodules=PIL.ImageOps",
+    "--exclude-module=PIL.ImageQt",
+    "--exclude-module=matplotlib",
+    "--exclude-module=numpy",
+    "--exclude-module=pandas",
+    "--exclude-module=scipy",
+    "--exclude-module=test",
+    "--exclude-module=unittest",
+    "--exclude-module=pydoc",
+    "--exclude-module=lib2to3",
+    "--exclude-module=distutils",
+)
+
+
+def run_command(cmd, shell=False, stream=False):
+    """Run a command and handle errors
+
+    With stream=True output is echoed line by line as it arrives instead of
+    being buffered, for long-running steps like PyInstaller.
+    """
+    if stream:
+        with subprocess.Popen(cmd, shell=shell, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        if proc.returncode != 0:
+            print(f"❌ Command FAILED: {subprocess.CalledProcessError(proc.returncode, cmd)}")
+            sys.exit(1)
+        print(f"✅ {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+        return subprocess.CompletedProcess(cmd, proc.returncode)
 
-
-def run_command(cmd, shell=False):
-    """Run a command and handle errors"""
     try:
         result = subprocess.run(cmd, shell=shell, check=True,
                                 capture_output=True, text=True)
@@ -32,8 +88,7 @@ def run_command(cmd, shell=False):
 
 def setup_build_environment():
     """Set up a virtual environment for building if needed"""
-    project_root = Path(__file__).parent.parent
-    venv_path = project_root / ".build_venv"
+    venv_path = PROJECT_ROOT / ".build_venv"
     
     # Check if we're already in a virtual environment or if PyInstaller is available
     if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -72,68 +127,162 @@ def check_dependencies(python_executable):
     """Check if required dependencies are installed"""
     print("Checking dependencies...")
     
-    # Install required packages for the build
-    required_packages = ["pyinstaller", "pillow"]
+    # Install required packages for the build (pip name -> import name)
+    required_packages = {"pyinstaller": "PyInstaller", "pillow": "PIL"}
+    
+    if python_executable == sys.executable:
+        missing = [package for package, module in required_packages.items()
+                   if importlib.util.find_spec(module) is None]
+    else:
+        # One interpreter start checks every package and prints the missing ones
+        probe = ("import importlib.util, sys\n"
+                 f"for package, module in {required_packages!r}.items():\n"
+                 "    if importlib.util.find_spec(module) is None: print(package)")
+        result = subprocess.run([python_executable, "-c", probe], 
+                              capture_output=True, text=True)
+        missing = result.stdout.split() if result.returncode == 0 else list(required_packages)
     
-    for package in required_packages:
+    if not missing:
+        print("✅ Pyinstaller and Pillow are installed")
+    else:
+        print(f"❌ Missing build dependencies. Installing {', '.join(missing)}...")
         try:
-            # Check if package is installed
-            result = subprocess.run([python_executable, "-c", f"import {package.replace('pillow', 'PIL')}"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✅ {package.title()} is installed")
-            else:
-                raise ImportError()
-        except (subprocess.CalledProcessError, ImportError):
-            print(f"❌ {package.title()} not found. Installing...")
+            run_command([python_executable, "-m", "pip", "install", *missing])
+        except SystemExit:
+            print("⚠️  Standard pip install failed. Trying with --user flag...")
             try:
-                run_command([python_executable, "-m", "pip", "install", package])
+                run_command([python_executable, "-m", "pip", "install", "--user", *missing])
             except SystemExit:
-                print(f"⚠️  Standard pip install failed for {package}. Trying with --user flag...")
-                try:
-                    run_command([python_executable, "-m", "pip", "install", "--user", package])
-                except SystemExit:
-                    print(f"❌ Failed to install {package}. Please install manually:")
-                    print(f"   {python_executable} -m pip install {package}")
-                    sys.exit(1)
+                print("❌ Failed to install build dependencies. Please install manually:")
+                print(f"   {python_executable} -m pip install {' '.join(missing)}")
+                sys.exit(1)
     
-    # Check if MKVToolNix is available
-    try:
-        result = subprocess.run(["mkvmerge", "--version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ MKVToolNix (mkvmerge) is available")
-        else:
-            print("⚠️  MKVToolNix not found in PATH. The built application will need it installed.")
-    except FileNotFoundError:
+    # Check if MKVToolNix is available (PATH lookup only, no need to run it)
+    if shutil.which("mkvmerge"):
+        print("✅ MKVToolNix (mkvmerge) is available")
+    else:
         print("⚠️  MKVToolNix not found in PATH. The built application will need it installed.")
 
 
+def pyinstaller_bundles_tcl_tk(python_executable):
+    """Return True if PyInstaller's _tkinter hook will collect Tcl/Tk by itself.
+
+    PyInstaller 5+ bundles the Tcl/Tk data next to _tkinter. This can only be
+    checked cheaply for the running interpreter; other interpreters fall back
+    to the manual collection.
+    """
+    if python_executable != sys.executable:
+        return False
+    if importlib.util.find_spec("_tkinter") is None:
+        return False
+    try:
+        from PyInstaller import __version__ as pyinstaller_version
+        return int(pyinstaller_version.split(".")[0]) >= 5
+    except Exception:
+        return False
+
+
+def _convert_icon_inproc(icon_path, xbm_path):
+    """Convert the PNG icon to a 32x32 monochrome XBM with Pillow in this process"""
+    from PIL import Image
+    img = Image.open(icon_path)
+    img = img.resize((32, 32), Image.Resampling.LANCZOS)
+    img = img.convert('1')  # Convert to monochrome bitmap
+    img.save(xbm_path)
+
+
+@functools.lru_cache(maxsize=1)
+def collect_tcl_tk_adddata(base_prefix=sys.base_prefix):
+    """Detect Tcl/Tk library directories and return a tuple of add-data strings.
+
+    Returns items in the form expected by PyInstaller: 'SRC:DEST' (uses
+    os.pathsep to be platform-correct). Only the first tcl* and first tk*
+    directory are used, since PyInstaller needs one of each.
+    """
+    # Common locations relative to Python installation, then system locations
+    base = Path(base_prefix)
+    candidates = [
+        base / 'lib' / 'tcl8.6',
+        base / 'lib' / 'tcl8.5',
+        base / 'lib' / 'tcl',
+        base / 'lib' / 'tk8.6',
+        base / 'lib' / 'tk8.5',
+        base / 'lib' / 'tk',
+        Path('/usr/lib') / 'tcl8.6',
+        Path('/usr/lib') / 'tcl8.5',
+        Path('/usr/lib') / 'tk8.6',
+        Path('/usr/lib') / 'tk8.5',
+        Path('/usr/share') / 'tcltk',
+        Path('/usr/share') / 'tcl8.6',
+        Path('/usr/share') / 'tk8.6',
+    ]
+
+    found = {}
+
+    def scan(paths):
+        for p in paths:
+            kind = 'tcl' if p.name.startswith('tcl') else 'tk'
+            if kind in found or not p.is_dir():
+                continue
+            try:
+                p = p.resolve()
+            except Exception:
+                continue
+            found[kind] = p
+            if len(found) == 2:
+                return
+
+    scan(candidates)
+
+    # Try to locate via tkinter module only if the simple candidates fell short
+    if len(found) < 2:
+        try:
+            import tkinter
+            tfile = Path(tkinter.__file__)
+            # tcl/tk runtime files may live near the tkinter package
+            scan([tfile.parent.parent / 'tcl', tfile.parent.parent / 'tk'])
+        except Exception:
+            # ignore import errors; we still have other candidates
+            pass
+
+    # Use a simple destination name inside the bundle (tcl/, tk/ etc)
+    return tuple(f"{p}{os.pathsep}{p.name}" for p in found.values())
+
+
 def build_executable(python_executable):
     """Build the standalone executable"""
     print("Building standalone executable...")
     
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
     
     # Determine output name based on platform
     system = platform.system().lower()
     exec_name = f"mkv-manager-{system}"
     
     # Convert PNG icon to formats that work better with tkinter on Linux
-    icon_path = project_root / "assets" / "icon.png"
-    converted_icon = None
+    icon_path = ASSETS / "icon.png"
+    xbm_path = ASSETS / "icon.xbm"
     
-    if icon_path.exists():
+    if (icon_path.exists() and xbm_path.exists()
+            and xbm_path.stat().st_mtime >= icon_path.stat().st_mtime):
+        # The PNG has not changed since the last conversion
+        print(f"✅ XBM icon up to date: {xbm_path}")
+    elif icon_path.exists() and python_executable == sys.executable:
+        # Pillow is importable here (check_dependencies), so skip the extra interpreter
+        print("Converting icon for Linux compatibility...")
+        try:
+            _convert_icon_inproc(icon_path, xbm_path)
+            print(f"✅ Created XBM icon: {xbm_path}")
+        except Exception as e:
+            print(f"❌ Icon conversion failed: {e}")
+            print("❌ NO XBM ICON CREATED - SYSTEM TRAY ICON WILL NOT WORK!")
+    elif icon_path.exists():
         print("Converting icon for Linux compatibility...")
         try:
             # Create XBM format using Pillow (works natively with tkinter)
-            xbm_path = project_root / "assets" / "icon.xbm"
-            
-            # Use Pillow to convert PNG to XBM
             convert_cmd = f"""
 import sys
-sys.path.insert(0, '{project_root}')
+sys.path.insert(0, '{PROJECT_ROOT}')
 from PIL import Image
 img = Image.open('{icon_path}')
 img = img.resize((32, 32), Image.Resampling.LANCZOS)
@@ -146,7 +295,6 @@ print('✅ Created XBM icon with Pillow')
                                   capture_output=True, text=True, check=False)
             
             if result.returncode == 0 and xbm_path.exists():
-                converted_icon = xbm_path
                 print(f"✅ Created XBM icon: {xbm_path}")
             else:
                 print(f"❌ Pillow conversion failed: {result.stderr}")
@@ -156,105 +304,28 @@ print('✅ Created XBM icon with Pillow')
             print(f"❌ Icon conversion failed: {e}")
             print("❌ NO XBM ICON CREATED - SYSTEM TRAY ICON WILL NOT WORK!")
     
-    def collect_tcl_tk_adddata():
-        """Detect Tcl/Tk library directories and return list of add-data strings.
-
-        Returns items in the form expected by PyInstaller: 'SRC:DEST' (uses
-        os.pathsep to be platform-correct).
-        """
-        candidates = []
-        adddata = []
-
-        # Common locations relative to Python installation
-        base = Path(sys.base_prefix)
-        candidates += [
-            base / 'lib' / 'tcl8.6',
-            base / 'lib' / 'tcl8.5',
-            base / 'lib' / 'tcl',
-            base / 'lib' / 'tk8.6',
-            base / 'lib' / 'tk8.5',
-            base / 'lib' / 'tk',
-        ]
-
-        # Common system locations
-        candidates += [
-            Path('/usr/lib') / 'tcl8.6',
-            Path('/usr/lib') / 'tcl8.5',
-            Path('/usr/lib') / 'tk8.6',
-            Path('/usr/lib') / 'tk8.5',
-            Path('/usr/share') / 'tcltk',
-            Path('/usr/share') / 'tcl8.6',
-            Path('/usr/share') / 'tk8.6',
-        ]
-
-        # Try to locate via tkinter module if available
-        try:
-            import tkinter
-            tfile = Path(tkinter.__file__)
-            # tcl/tk runtime files may live near the tkinter package
-            candidates.append(tfile.parent.parent / 'tcl')
-            candidates.append(tfile.parent.parent / 'tk')
-        except Exception:
-            # ignore import errors; we still have other candidates
-            pass
-
-        seen = set()
-        for p in candidates:
-            try:
-                p = p.resolve()
-            except Exception:
-                continue
-            if p.exists() and p.is_dir() and str(p) not in seen:
-                seen.add(str(p))
-                # Use a simple destination name inside the bundle (tcl/, tk/ etc)
-                dest_name = p.name
-                adddata.append(f"{p}{os.pathsep}{dest_name}")
-
-        return adddata
-
+    # Add Tcl/Tk data directories if found (makes the binary more self-contained),
+    # unless PyInstaller's own tkinter hook already bundles them
+    if pyinstaller_bundles_tcl_tk(python_executable):
+        print("✅ Relying on PyInstaller built-in tkinter hook for Tcl/Tk")
+        tcl_adddata = ()
+    else:
+        tcl_adddata = collect_tcl_tk_adddata()
 
-    # Build command
+    # Build command: static options plus the per-build name, icon and Tcl/Tk data
     cmd = [
         python_executable, "-m", "PyInstaller",
-        "--onefile",
-        "--windowed",
         f"--name={exec_name}",
-        "--add-data=core:core",
-        "--add-data=desktop:desktop",
-        "--add-data=assets:assets",  # Include assets folder for runtime access
-        "--hidden-import=tkinter",
-        "--hidden-import=tkinter.ttk",
-        "--hidden-import=tkinter.filedialog",
-        "--hidden-import=tkinter.messagebox",
-        "--hidden-import=tkinter.font",
-        "--hidden-import=tkinterdnd2",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageTk",
-        "--hidden-import=PIL.ImageOps",
-        "--hidden-import=Pillow",
-        "--collect-all=PIL",
-        "--exclude-module=matplotlib",
-        "--exclude-module=numpy",
-        "--exclude-module=pandas",
-        "--exclude-module=scipy",
-        "desktop/main.py"
+        *_PYI_BASE_ARGS,
+        *([f"--icon={icon_path}"] if icon_path.exists() else []),
+        *[f"--add-data={ad}" for ad in tcl_adddata],
+        "desktop/main.py",
     ]
     
-    # Add icon if available
-    icon_path = project_root / "assets" / "icon.png"
-    if icon_path.exists():
-        cmd.extend([f"--icon={icon_path}"])
-
-    # Add Tcl/Tk data directories if found (makes the binary more self-contained)
-    tcl_adddata = collect_tcl_tk_adddata()
-    for ad in tcl_adddata:
-        cmd.append(f"--add-data={ad}")
-    
-    run_command(cmd)
+    run_command(cmd, stream=True)
     
     # Check if executable was created
-    dist_dir = project_root / "dist"
+    dist_dir = PROJECT_ROOT / "dist"
     executable = dist_dir / exec_name
     
     if executable.exists():
@@ -305,6 +376,65 @@ StartupNotify=true
         print(f"⚠️  Could not create desktop entry: {e}")
 
 
+def _copy_large(src, dst):
+    """Copy a large file like shutil.copy2 without keeping the source cached.
+
+    The source is read sequentially with a hint for bigger readahead and its
+    pages are dropped afterwards. The copy is left cached, since appimagetool
+    reads it straight back when packing the AppDir.
+    """
+    chunk = 4 * 1024 * 1024
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # sendfile() into a regular file is Linux-only (macOS needs a socket)
+        if sys.platform.startswith("linux"):
+            offset = 0
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, chunk)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(fsrc, fdst, chunk)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    shutil.copystat(src, dst)
+    return dst
+
+
+APPIMAGETOOL_CACHE_DIR = Path.home() / ".cache" / "mkv-manager"
+
+
+def _download_cached(url, dest):
+    """Download url to dest, revalidating an existing copy with If-Modified-Since"""
+    request = urllib.request.Request(url)
+    if dest.exists():
+        request.add_header("If-Modified-Since",
+                           formatdate(dest.stat().st_mtime, usegmt=True))
+    try:
+        resp = urllib.request.urlopen(request, timeout=60)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            print(f"Using cached appimagetool: {dest}")
+            return dest
+        raise
+    except urllib.error.URLError:
+        if dest.exists():
+            print(f"⚠️  Download failed; using cached appimagetool: {dest}")
+            return dest
+        raise
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    partial = dest.with_name(dest.name + ".part")
+    with resp, open(partial, "wb") as f:
+        shutil.copyfileobj(resp, f, 1024 * 1024)
+    os.replace(partial, dest)
+    print(f"Downloaded appimagetool to {dest}")
+    return dest
+
+
 def create_appimage(executable_path, exec_name, desktop_name="MKV Manager"):
     """Create a minimal AppImage from the built executable.
 
@@ -317,8 +447,7 @@ def create_appimage(executable_path, exec_name, desktop_name="MKV Manager"):
         print("AppImage generation skipped: not running on Linux")
         return None
 
-    project_root = Path(__file__).parent.parent
-    appdir = project_root / f"{exec_name}.AppDir"
+    appdir = PROJECT_ROOT / f"{exec_name}.AppDir"
 
     try:
         # Prepare directories
@@ -329,39 +458,12 @@ def create_appimage(executable_path, exec_name, desktop_name="MKV Manager"):
         for d in (usr_bin, icons_dir, apps_dir):
             d.mkdir(parents=True, exist_ok=True)
 
-        # Copy executable
         target_exec = usr_bin / exec_name
-        shutil.copy2(executable_path, target_exec)
-        target_exec.chmod(0o755)
-
-        # Desktop file for AppDir root
-        desktop_file = appdir / f"{exec_name}.desktop"
-        icon_src = project_root / "assets" / "icon.png"
-        
-        # Copy icon to AppDir root for AppImage compatibility
-        if icon_src.exists():
-            shutil.copy2(icon_src, appdir / "icon.png")
-            icon_name = "icon"
-        else:
-            icon_name = "video-x-generic"
-            
-        desktop_content = f"""[Desktop Entry]
-Name={desktop_name}
-Exec={exec_name}
-Icon={icon_name}
-Type=Application
-Categories=AudioVideo;Video;
-Terminal=false
-"""
-        desktop_file.write_text(desktop_content, encoding="utf-8")
-
-        # Copy icon if available
-        if icon_src.exists():
-            shutil.copy2(icon_src, icons_dir / icon_src.name)
+        icon_src = ASSETS / "icon.png"
 
         # Try to find appimagetool
         appimagetool = shutil.which("appimagetool")
-        downloaded = False
+        download_tmp = None
         if not appimagetool:
             print("appimagetool not found in PATH; attempting to download latest AppImage...")
             # Use the continuous release for x86_64; adjust for other archs
@@ -374,36 +476,57 @@ Terminal=false
             else:
                 url = "https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage"
 
-            tmp = Path(tempfile.mkdtemp()) / "appimagetool.AppImage"
+            # Cached across builds; _download_cached only refetches when upstream changed
+            download_tmp = APPIMAGETOOL_CACHE_DIR / url.rsplit("/", 1)[-1]
+
+        # The download and the AppDir copies are independent I/O, so run them together
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            download = None
+            if download_tmp is not None:
+                download = pool.submit(_download_cached, url, download_tmp)
+            copies = [pool.submit(_copy_large, executable_path, target_exec)]
+            if icon_src.exists():
+                # AppDir root copy for AppImage compatibility, plus the hicolor theme copy
+                copies.append(pool.submit(shutil.copy2, icon_src, appdir / "icon.png"))
+                copies.append(pool.submit(shutil.copy2, icon_src, icons_dir / icon_src.name))
+
+            # Desktop file for AppDir root
+            desktop_file = appdir / f"{exec_name}.desktop"
+            icon_name = "icon" if icon_src.exists() else "video-x-generic"
+            desktop_content = f"""[Desktop Entry]
+Name={desktop_name}
+Exec={exec_name}
+Icon={icon_name}
+Type=Application
+Categories=AudioVideo;Video;
+Terminal=false
+"""
+            desktop_file.write_text(desktop_content, encoding="utf-8")
+
+            for copy in copies:
+                copy.result()
+            target_exec.chmod(0o755)
 
-            try:
-                urllib.request.urlretrieve(url, str(tmp))
-                tmp.chmod(tmp.stat().st_mode | stat.S_IXUSR)
-                appimagetool = str(tmp)
-                downloaded = True
-                print(f"Downloaded appimagetool to {tmp}")
-            except Exception as e:
-                print(f"❌ Failed to download appimagetool: {e}")
-                return None
+            if download is not None:
+                try:
+                    download.result()
+                    download_tmp.chmod(download_tmp.stat().st_mode | stat.S_IXUSR)
+                    appimagetool = str(download_tmp)
+                except Exception as e:
+                    print(f"❌ Failed to download appimagetool: {e}")
+                    return None
 
         # Build AppImage
-        dist_dir = project_root / "dist"
+        dist_dir = PROJECT_ROOT / "dist"
         dist_dir.mkdir(exist_ok=True)
         output_appimage = dist_dir / f"{exec_name}.AppImage"
 
         cmd = [appimagetool, str(appdir), str(output_appimage)]
         print(f"Running: {' '.join(cmd)}")
-        run_command(cmd)
+        run_command(cmd, stream=True)
 
         print(f"✅ AppImage created: {output_appimage}")
 
-        # Remove temporary downloaded appimagetool
-        if downloaded:
-            try:
-                Path(appimagetool).unlink()
-            except Exception:
-                pass
-
         return output_appimage
 
     except Exception as e:
@@ -411,33 +534,36 @@ Terminal=false
         return None
 
 
-def cleanup_build_artifacts():
-    """Clean up build artifacts"""
-    project_root = Path(__file__).parent.parent    
-    build_dir = project_root / "build"
+def cleanup_build_artifacts(clean=False):
+    """Clean up build artifacts
+
+    build/ is PyInstaller's analysis cache and is only removed when clean is set.
+    """
+    build_dir = PROJECT_ROOT / "build"
 
-    if build_dir.exists():
+    if clean and build_dir.exists():
         shutil.rmtree(build_dir)
         print("✅ Cleaned up build directory")
     
-    # Clean up AppDir (build artifact that shouldn't remain in project)
-    appdir_pattern = "*linux.AppDir"
-    appdir_paths = list(project_root.glob(appdir_pattern))
-    for appdir in appdir_paths:
-        if appdir.is_dir():
-            shutil.rmtree(appdir)
-            print(f"✅ Cleaned up AppDir: {appdir}")
-    
-    # Keep dist directory but clean up .spec file
-    spec_files = list(project_root.glob("*.spec"))
-
-    for spec_file in spec_files:
-        spec_file.unlink()
-        print(f"✅ Removed {spec_file}")
+    # Clean up AppDir (build artifact that shouldn't remain in project) and
+    # .spec files (dist directory is kept) in a single pass over the project root
+    with os.scandir(PROJECT_ROOT) as it:
+        for entry in it:
+            if entry.name.endswith("linux.AppDir") and entry.is_dir():
+                shutil.rmtree(entry.path)
+                print(f"✅ Cleaned up AppDir: {entry.path}")
+            elif entry.name.endswith(".spec") and entry.is_file():
+                os.unlink(entry.path)
+                print(f"✅ Removed {entry.path}")
 
 
 def main():
     """Main build function"""
+    parser = argparse.ArgumentParser(description="Build MKV Manager for Linux/macOS")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove the build/ cache after building")
+    args = parser.parse_args()
+
     print("MKV Manager Linux/macOS Build Script")
     print("=" * 40)
     
@@ -466,7 +592,7 @@ def main():
             if appimage:
                 print(f"AppImage available at: {appimage}")
         
-        cleanup_build_artifacts()
+        cleanup_build_artifacts(args.clean)
         
         print()
         print("Build completed successfully!")
@@ -5,16 +5,36 @@ Creates a Windows installer while ensuring license compliance through mandatory
 """
 
 import os
+import argparse
 import sys
 import subprocess
 import platform
 import tempfile
 import shutil
+import functools
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ASSETS = PROJECT_ROOT / "assets"
+
+
+def run_command(cmd, shell=False, stream=False):
+    """Run a command and handle errors
+
+    With stream=True output is echoed line by line as it arrives instead of
+    being buffered, for long-running steps like PyInstaller.
+    """
+    if stream:
+        with subprocess.Popen(cmd, shell=shell, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        if proc.returncode != 0:
+            print(f"   Command FAILED: {subprocess.CalledProcessError(proc.returncode, cmd)}")
+            sys.exit(1)
+        print(f"✅ {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+        return subprocess.CompletedProcess(cmd, proc.returncode)
 
-def run_command(cmd, shell=False):
-    """Run a command and handle errors"""
     try:
         result = subprocess.run(cmd, shell=shell, check=True,
                                 capture_output=True, text=True)
@@ -68,68 +88,60 @@ def build_executable():
     """Build executable for installer packaging"""
     print("Building executable (installer packaging mode)...")
 
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
 
     # Ensure a Windows .ico exists so the PyInstaller spec can include it
-    ico_path = ensure_windows_icon(project_root)
+    ico_path = ensure_windows_icon(PROJECT_ROOT)
     if ico_path:
         print(f"Using icon: {ico_path}")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Keep the temp directory on the same filesystem as dist/ so the result can be moved, not copied
+    with tempfile.TemporaryDirectory(prefix=".build_", dir=str(PROJECT_ROOT)) as temp_dir:
         print(f"Using temporary build directory: {temp_dir}")
 
         spec_path = "packaging/pyinstaller/mkv_cleaner.spec"
 
-        temp_spec = Path(temp_dir) / "mkv_cleaner_temp.spec"
-        with open(spec_path, 'r') as f:
-            spec_content = f.read()
+        # The spec resolves its own paths (icon included) from SPECPATH, so it
+        # is built in place; dist output goes to the temp directory while
+        # build/ stays in the project as PyInstaller's reusable analysis cache
+        run_command([sys.executable, "-m", "PyInstaller",
+                     "--distpath", str(Path(temp_dir) / "dist"),
+                     "--workpath", str(PROJECT_ROOT / "build"),
+                     "--noconfirm",
+                     spec_path], stream=True)
 
-        modified_content = spec_content.replace(
-            "name='MKV_Cleaner'",
-            f"name='MKV_Cleaner',\n    distpath='{temp_dir}/dist'"
-        )
+        # One-folder build: the whole MKV_Cleaner/ directory is packaged by NSIS
+        temp_app_dir = Path(temp_dir) / "dist" / "MKV_Cleaner"
+        final_app_dir = PROJECT_ROOT / "dist" / "MKV_Cleaner"
 
-        # If we created an icon.ico in assets, patch the spec so the icon path
-        # is an absolute path. This avoids relative-path issues when the spec
-        # is executed from a temporary directory.
-        if ico_path and ico_path.exists():
-            abs_ico = ico_path.resolve().as_posix()
-            # Replace the conditional expression in the spec with an absolute path
-            modified_content = modified_content.replace(
-                "icon='../../assets/icon.ico' if os.path.exists('../../assets/icon.ico') else None,",
-                f"icon=r'{abs_ico}',"
-            )
+        final_app_dir.parent.mkdir(exist_ok=True)
+        if final_app_dir.exists():
+            shutil.rmtree(final_app_dir)
 
-        with open(temp_spec, 'w') as f:
-            f.write(modified_content)
-
-        run_command([sys.executable, "-m", "PyInstaller", str(temp_spec)])
-
-        temp_exe = Path(temp_dir) / "dist" / "MKV_Cleaner.exe"
-        final_exe = project_root / "dist" / "MKV_Cleaner.exe"
+        try:
+            os.replace(temp_app_dir, final_app_dir)
+        except OSError:
+            # Different filesystem (EXDEV) or a locked target: fall back to copying
+            shutil.copytree(temp_app_dir, final_app_dir)
+        print(f"Executable ready for installer packaging")
 
-        final_exe.parent.mkdir(exist_ok=True)
 
-        shutil.copy2(temp_exe, final_exe)
-        print(f"Executable ready for installer packaging")
+@functools.lru_cache(maxsize=1)
+def find_makensis():
+    """Locate makensis once: PATH first (honours PATHEXT), then the default install locations"""
+    nsis_paths = [
+        r"C:\Program Files (x86)\NSIS\makensis.exe",
+        r"C:\Program Files\NSIS\makensis.exe"
+    ]
+    return shutil.which("makensis") or next(
+        (path for path in nsis_paths if os.path.isfile(path)), None)
 
 
 def build_installer_windows():
     """Build Windows installer using NSIS"""
     print("Building Windows installer with NSIS...")
 
-    nsis_paths = [
-        r"C:\Program Files (x86)\NSIS\makensis.exe",
-        r"C:\Program Files\NSIS\makensis.exe",
-        r"makensis.exe"
-    ]
-
-    nsis_exe = None
-    for path in nsis_paths:
-        if os.path.exists(path) or path == "makensis.exe":
-            nsis_exe = path
-            break
+    nsis_exe = find_makensis()
 
     if not nsis_exe:
         print("❌ NSIS not found. Please install NSIS from https://nsis.sourceforge.io/")
@@ -138,10 +150,10 @@ def build_installer_windows():
     nsi_script = "packaging/nsis/installer.nsi"
     
     # Check if custom icon exists and pass it to NSIS
-    project_root = Path(__file__).parent.parent
-    ico_path = project_root / "assets" / "icon.ico"
+    ico_path = ASSETS / "icon.ico"
     
-    cmd = [nsis_exe]
+    # /V2 keeps makensis from printing every file into the captured output
+    cmd = [nsis_exe, "/V2", "/NOCONFIG"]
     if ico_path.exists():
         cmd.extend([f"/DCUSTOM_ICON={ico_path.resolve()}"])
         print(f"Using custom icon for installer: {ico_path}")
@@ -150,25 +162,32 @@ def build_installer_windows():
     run_command(cmd)
 
 
-def cleanup_build_artifacts():
-    """Remove build artifacts"""
+def cleanup_build_artifacts(clean=False):
+    """Remove build artifacts
+
+    build/ is PyInstaller's analysis cache and is only removed when clean is set.
+    """
     print("Cleaning up build artifacts...")
 
-    project_root = Path(__file__).parent.parent
 
-    dist_dir = project_root / "dist"
+    dist_dir = PROJECT_ROOT / "dist"
     if dist_dir.exists():
         shutil.rmtree(dist_dir)
         print("✅ Removed dist/ directory")
 
-    build_dir = project_root / "build"
-    if build_dir.exists():
+    build_dir = PROJECT_ROOT / "build"
+    if clean and build_dir.exists():
         shutil.rmtree(build_dir)
         print("✅ Removed build/ directory")
 
 
 def main():
     """Main build function to create installer"""
+    parser = argparse.ArgumentParser(description="Build the MKV Manager Windows installer")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove the build/ cache after building")
+    args = parser.parse_args()
+
     print("MKV Manager Build Script")
     print("=" * 40)
     print("Building installer distribution")
@@ -185,7 +204,7 @@ def main():
     try:
         build_executable()
         build_installer_windows()
-        cleanup_build_artifacts()
+        cleanup_build_artifacts(args.clean)
 
         print("✅ Windows installer created: MKV_Cleaner_Installer.exe")
 
@@ -12,6 +12,9 @@ flask_datas, flask_binaries, flask_hiddenimports = collect_all('flask')
 # Get Python installation path for bundling system libraries
 python_base = sys.base_prefix
 
+# Resolved from the spec's own directory so the build works from any cwd
+icon_path = os.path.join(SPECPATH, '..', '..', 'assets', 'icon.ico')
+
 a = Analysis(
     ['../../desktop/main.py'],
     pathex=['../..'],
@@ -56,17 +59,17 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# One-folder build: nothing is unpacked to %TEMP% on launch, NSIS ships the folder
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='MKV_Cleaner',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,  # Compress executable
+    upx=False,  # No UPX pass at build time or decompression at start
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,  # No console window
@@ -76,5 +79,15 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
     # Add icon if available
-    icon='../../assets/icon.ico' if os.path.exists('../../assets/icon.ico') else None,
+    icon=icon_path if os.path.exists(icon_path) else None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='MKV_Cleaner',
 )